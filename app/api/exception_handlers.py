@@ -3,7 +3,7 @@ Exception handlers for the API layer
 """
 from datetime import datetime, UTC
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from typing import Any, Dict, Optional, Type, Union
 
@@ -35,7 +35,7 @@ async def create_error_response(
         details: Additional error details
         
     Returns:
-        JSONResponse with standardized error format
+        JSONResponse with standardized error format (encoded with orjson)
     """
     error_response = ErrorResponse(
         error=message,
@@ -43,7 +43,9 @@ async def create_error_response(
         timestamp=datetime.now(UTC).isoformat(),
         details=details
     )
-    return JSONResponse(
+    # Error bodies carry a timestamp, so they cannot be pre-encoded; orjson keeps
+    # encoding cheap when clients hammer failing endpoints
+    return ORJSONResponse(
         status_code=status_code,
         content=error_response.model_dump(exclude_none=True)
     )
@@ -4,12 +4,13 @@ Request logging middleware
 """
 import logging
 import time
-import uuid
 from typing import Callable
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.utils.helpers import generate_correlation_id
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,40 +19,44 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Generate correlation ID
-        correlation_id = str(uuid.uuid4())
+        correlation_id = generate_correlation_id()
         request.state.correlation_id = correlation_id
 
         # Start timing
         start_time = time.time()
 
+        # Checked per request since logging is configured after the middleware is built;
+        # skips building the extra dicts and str(request.url) when INFO is filtered out
+        log_info = logger.isEnabledFor(logging.INFO)
+
         # Log request
-        logger.info(
-            "Request started",
-            extra={
-                "correlation_id": correlation_id,
-                "method": request.method,
-                "url": str(request.url),
-                "client_host": request.client.host if request.client else None,
-                "user_agent": request.headers.get("user-agent"),
-            },
-        )
+        if log_info:
+            logger.info(
+                "Request started",
+                extra={
+                    "correlation_id": correlation_id,
+                    "method": request.method,
+                    "url": str(request.url),
+                    "client_host": request.client.host if request.client else None,
+                    "user_agent": request.headers.get("user-agent"),
+                },
+            )
 
         try:
             # Process request
             response = await call_next(request)
 
-            # Calculate duration
-            duration = time.time() - start_time
-
             # Log response
-            logger.info(
-                "Request completed",
-                extra={
-                    "correlation_id": correlation_id,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration * 1000, 2),
-                },
-            )
+            if log_info:
+                duration = time.time() - start_time
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "status_code": response.status_code,
+                        "duration_ms": round(duration * 1000, 2),
+                    },
+                )
 
             # Add correlation ID to response headers
             response.headers["X-Correlation-ID"] = correlation_id
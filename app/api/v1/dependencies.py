@@ -7,6 +7,7 @@ from uuid import UUID
 
 from fastapi import Header, HTTPException
 
+from app.utils.helpers import generate_correlation_id
 from app.utils.validators import validate_uuid
 
 
@@ -18,9 +19,7 @@ async def get_correlation_id(
         return x_correlation_id
 
     # If not provided, generate one (this should be handled by middleware)
-    import uuid
-
-    return str(uuid.uuid4())
+    return generate_correlation_id()
 
 
 async def validate_task_id(task_id: str) -> UUID:
@@ -51,7 +51,7 @@ async def generate_webtoon(
             from app.domain.constants.art_styles import ensure_art_style_string
             
             # Create a JSON-serializable dictionary from the DTO
-            request_dict = request_dto.dict()
+            request_dict = request_dto.model_dump()
             
             # Ensure art_style is a valid string using our helper
             if 'art_style' in request_dict:
@@ -5,8 +5,9 @@ Webtoon management API routes
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 
 from app.application.services.webtoon_service import WebtoonService
 from app.dependencies import get_webtoon_service
@@ -21,6 +22,16 @@ from app.schemas.webtoon_schemas import (
 router = APIRouter()
 
 
+def _render(model: BaseModel) -> Response:
+    """Serialize a response model in one pydantic-core pass.
+
+    Returning a Response skips FastAPI's re-validation of the model against
+    ``response_model`` and its jsonable_encoder walk; ``response_model`` is
+    kept on the routes for the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 @router.post("/", response_model=WebtoonResponse)
 async def create_webtoon(
     request: WebtoonCreateRequest,
@@ -32,7 +43,7 @@ async def create_webtoon(
         description=request.description,
         art_style=request.art_style,
     )
-    return WebtoonResponse.from_dto(webtoon_dto)
+    return _render(WebtoonResponse.from_dto(webtoon_dto))
 
 
 @router.get("/{webtoon_id}", response_model=WebtoonResponse)
@@ -58,7 +69,7 @@ async def get_webtoon(
             raise BadRequestException("Failed to generate HTML content")
         response.html_content = html_content
         
-    return response
+    return _render(response)
 
 
 @router.get("/", response_model=WebtoonListResponse)
@@ -73,9 +84,11 @@ async def list_webtoons(
         # Get all webtoons (in production, add pagination)
         webtoons = await service.get_all_webtoons()
 
-    return WebtoonListResponse(
-        webtoons=[WebtoonResponse.from_dto(w) for w in webtoons],
-        total=len(webtoons),
+    return _render(
+        WebtoonListResponse.model_construct(
+            webtoons=[WebtoonResponse.from_dto(w) for w in webtoons],
+            total=len(webtoons),
+        )
     )
 
 
@@ -104,7 +117,7 @@ async def add_character(
         raise NotFoundException("Webtoon not found")
     
     # Return a consistent response model
-    return WebtoonResponse.from_dto(webtoon_dto)
+    return _render(WebtoonResponse.from_dto(webtoon_dto))
 
 
 @router.post("/{webtoon_id}/panels", response_model=WebtoonResponse)
@@ -127,7 +140,7 @@ async def add_panel(
         raise NotFoundException("Webtoon not found")
     
     # Return a consistent response model
-    return WebtoonResponse.from_dto(webtoon_dto)
+    return _render(WebtoonResponse.from_dto(webtoon_dto))
 
 
 @router.patch("/{webtoon_id}/publish", response_model=WebtoonResponse)
@@ -142,4 +155,4 @@ async def publish_webtoon(
     
     # Get the updated webtoon to return a consistent response
     webtoon_dto = await service.get_webtoon(webtoon_id)
-    return WebtoonResponse.from_dto(webtoon_dto)
+    return _render(WebtoonResponse.from_dto(webtoon_dto))
@@ -5,7 +5,7 @@ API schemas for chat functionality
 from datetime import datetime
 from typing import Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_serializer
 
 
 class ToolCallResponse(BaseModel):
@@ -32,12 +32,10 @@ class ChatMessageResponse(BaseModel):
     tool_calls: List[ToolCallResponse] = Field(default_factory=list, description="Tool calls in this message")
     metadata: Dict = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        """Pydantic config"""
-        
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
+    @field_serializer("timestamp", when_used="json")
+    def serialize_timestamp(self, value: datetime) -> str:
+        """Keep isoformat() offsets rather than pydantic's 'Z' suffix"""
+        return value.isoformat()
 
 
 class ChatRoomResponse(BaseModel):
@@ -51,9 +49,7 @@ class ChatRoomResponse(BaseModel):
     participant_count: int = Field(0, description="Number of current participants")
     metadata: Dict = Field(default_factory=dict, description="Additional metadata")
 
-    class Config:
-        """Pydantic config"""
-        
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
+    @field_serializer("created_at", "updated_at", when_used="json")
+    def serialize_datetimes(self, value: datetime) -> str:
+        """Serialize room timestamps with isoformat(), as the other chat responses do"""
+        return value.isoformat()
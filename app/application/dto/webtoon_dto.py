@@ -2,16 +2,19 @@
 """
 Webtoon Data Transfer Objects
 """
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import List, NamedTuple, Optional, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel
-
 # Using string literals for art style
 
+# These DTOs are built in bulk from already-valid entities and only read
+# afterwards, so they are plain slotted dataclasses rather than pydantic models
+
 
-class CharacterDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CharacterDTO:
     """Character data transfer object"""
 
     id: UUID
@@ -22,28 +25,37 @@ class CharacterDTO(BaseModel):
     role: str
 
 
-class PanelDTO(BaseModel):
+class DialogueDTO(NamedTuple):
+    """One line of panel dialogue"""
+
+    character: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class PanelDTO:
     """Panel data transfer object"""
 
     id: UUID
     sequence_number: int
     scene_description: str
     character_names: List[str]
-    dialogue: List[Dict[str, str]]
+    dialogue: Tuple[DialogueDTO, ...]
     visual_effects: List[str]
     image_url: Optional[str] = None
     generated_at: Optional[datetime] = None
 
 
-class WebtoonDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class WebtoonDTO:
     """Webtoon data transfer object"""
 
     id: UUID
     title: str
     description: str
     art_style: str
-    panels: List[PanelDTO]
-    characters: List[CharacterDTO]
+    panels: Tuple[PanelDTO, ...]
+    characters: Tuple[CharacterDTO, ...]
     created_at: datetime
     updated_at: datetime
     is_published: bool
@@ -3,7 +3,7 @@
 AI provider interface for language model interactions
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class AIProvider(ABC):
@@ -21,6 +21,22 @@ class AIProvider(ABC):
     ) -> List[Dict[str, Any]]:
         """Generate scene descriptions for panels"""
 
+    async def generate_story_and_scenes(
+        self,
+        prompt: str,
+        style: str,
+        additional_context: Optional[str],
+        num_panels: int,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Generate a story structure and its panel scene descriptions together
+
+        Providers that can return both from one request should override this;
+        the default makes the story and scene calls one after the other.
+        """
+        story = await self.generate_story(prompt, style, additional_context)
+        scenes = await self.generate_scene_descriptions(story, num_panels)
+        return story, scenes
+
     @abstractmethod
     async def generate_dialogue(
         self, scene_description: str, character_names: List[str], mood: str
@@ -2,6 +2,7 @@
 """
 Storage provider interface for data persistence
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -13,10 +14,21 @@ class StorageProvider(ABC):
     async def store(self, key: str, data: Any) -> bool:
         """Store data with a key"""
 
+    async def store_many(self, items: Dict[str, Any]) -> bool:
+        """Store several key/value pairs; providers with a bulk write should override"""
+        results = await asyncio.gather(
+            *(self.store(key, data) for key, data in items.items())
+        )
+        return all(results)
+
     @abstractmethod
     async def retrieve(self, key: str) -> Optional[Any]:
         """Retrieve data by key"""
 
+    async def retrieve_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several keys in order; providers with a bulk read should override"""
+        return list(await asyncio.gather(*(self.retrieve(key) for key in keys)))
+
     @abstractmethod
     async def delete(self, key: str) -> bool:
         """Delete data by key"""
@@ -53,11 +53,17 @@ class BaseService(ABC):
             context: Optional context about the error
         """
         if self._error_handler:
-            # Run in the background to avoid blocking
             import asyncio
-            asyncio.create_task(self._error_handler.handle_error(error, context))
-        else:
-            self._logger.error("Unhandled error: %s", str(error), exc_info=True, extra={"context": context or {}})
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Called from a worker thread (e.g. via asyncio.to_thread); nothing to schedule on
+                loop = None
+            if loop is not None:
+                # Run in the background to avoid blocking
+                loop.create_task(self._error_handler.handle_error(error, context))
+                return
+        self._logger.error("Unhandled error: %s", str(error), exc_info=True, extra={"context": context or {}})
     
     def log_debug(self, message: str, **kwargs) -> None:
         """Log a debug message with additional context."""
@@ -0,0 +1,144 @@
+# app/application/services/batcher.py
+"""
+Coalescing of concurrent calls into batches.
+
+Services that make one storage round trip per caller queue their items here
+instead; a background flusher hands them to a batch callable and resolves each
+caller with its own result.
+"""
+import asyncio
+import logging
+from typing import (
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Batcher(Generic[T, R]):
+    """Queue items from concurrent callers and process them in batches
+
+    A lone item is flushed right away, so an uncontended call pays no batching
+    delay. Items that pile up while a flush is running, or that arrive
+    together, go out as one batch.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[Sequence[R]]],
+        max_batch_size: int = 32,
+        flush_interval: float = 0.005,
+        name: str = "items",
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            flush: Processes a batch and returns one result per item, in order
+            max_batch_size: Flush as soon as this many items are queued
+            flush_interval: Seconds to wait for more items once several are
+                queued together
+            name: What the items are, for log messages
+        """
+        self._flush = flush
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.name = name
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, item: T) -> R:
+        """
+        Queue an item and wait until its batch has been processed.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            The result the flush callable returned for this item
+
+        Raises:
+            Exception: Whatever the flush callable raised for the batch
+        """
+        loop = asyncio.get_running_loop()
+        self._ensure_flusher(loop)
+        result = loop.create_future()
+        self._queue.put_nowait((item, result))
+        return await result
+
+    def _ensure_flusher(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the flusher on the running loop if it is not already running there"""
+        if self._loop is not loop:
+            # Celery tasks run each call in a fresh event loop; a queue is bound
+            # to its loop, so only a new loop gets a new queue
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._flusher = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Collect queued items into batches and flush them"""
+        batch: List[Tuple[T, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < self.max_batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                if len(batch) > 1:
+                    # Several callers arrived together; give the burst a moment to fill
+                    deadline = self._loop.time() + self.flush_interval
+                    while len(batch) < self.max_batch_size:
+                        timeout = deadline - self._loop.time()
+                        if timeout <= 0:
+                            break
+                        try:
+                            batch.append(
+                                await asyncio.wait_for(self._queue.get(), timeout)
+                            )
+                        except asyncio.TimeoutError:
+                            break
+                await self._process(batch)
+                batch = []
+        finally:
+            # Only cancellation or a BaseException from the flush gets here; fail
+            # everyone still waiting so no caller hangs on an unflushed item
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            error = RuntimeError(
+                f"Batcher stopped before flushing {len(batch)} {self.name}"
+            )
+            for _, result in batch:
+                if not result.done():
+                    result.set_exception(error)
+
+    async def _process(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """Flush one batch and resolve the futures of everyone waiting on it"""
+        try:
+            results = await self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch flush returned {len(results)} results for {len(batch)} {self.name}"
+                )
+        except Exception as e:
+            logger.error("Error flushing %s %s: %s", len(batch), self.name, e)
+            for _, result in batch:
+                if not result.done():
+                    result.set_exception(e)
+            return
+
+        logger.debug("Flushed %s %s", len(batch), self.name)
+        for (_, result), value in zip(batch, results):
+            if not result.done():
+                result.set_result(value)
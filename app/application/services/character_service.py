@@ -3,13 +3,28 @@
 Character management service for generating and managing characters in the webtoon.
 """
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.application.interfaces.ai_provider import AIProvider
 from app.application.services.base_service import BaseService
 from app.core.error_handling.base_error_handler import BaseErrorHandler
 from app.domain.entities.character import Character, CharacterAppearance
 
+# How the first role relates to the second, keyed by (role, other_role)
+_ROLE_RELATIONSHIPS: Dict[Tuple[str, str], str] = {
+    ("protagonist", "antagonist"): "enemy",
+    ("antagonist", "protagonist"): "enemy",
+    ("protagonist", "supporting"): "ally",
+    ("supporting", "protagonist"): "supports",
+    ("protagonist", "love_interest"): "romantic",
+    ("love_interest", "protagonist"): "romantic",
+    ("supporting", "supporting"): "friend",
+    ("mentor", "protagonist"): "mentor",
+    ("protagonist", "mentor"): "student",
+    ("sidekick", "protagonist"): "sidekick",
+    ("protagonist", "sidekick"): "mentor",
+}
+
 
 class CharacterService(BaseService):
     """
@@ -323,21 +338,7 @@ class CharacterService(BaseService):
                 )
                 return None
                 
-            role_relationships = {
-                ("protagonist", "antagonist"): "enemy",
-                ("antagonist", "protagonist"): "enemy",
-                ("protagonist", "supporting"): "ally",
-                ("supporting", "protagonist"): "supports",
-                ("protagonist", "love_interest"): "romantic",
-                ("love_interest", "protagonist"): "romantic",
-                ("supporting", "supporting"): "friend",
-                ("mentor", "protagonist"): "mentor",
-                ("protagonist", "mentor"): "student",
-                ("sidekick", "protagonist"): "sidekick",
-                ("protagonist", "sidekick"): "mentor"
-            }
-
-            relationship = role_relationships.get((char1.role.lower(), char2.role.lower()))
+            relationship = _ROLE_RELATIONSHIPS.get((char1.role.lower(), char2.role.lower()))
             
             if not relationship:
                 self.logger.debug(
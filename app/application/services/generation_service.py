@@ -40,26 +40,136 @@ Example:
         )
     ```
 """
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import itertools
 import logging
+import operator
 from datetime import UTC, datetime
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from app.application.dto.generation_dto import GenerationRequestDTO, GenerationResultDTO
 from app.application.interfaces.ai_provider import AIProvider
 from app.application.interfaces.image_generator import ImageGenerator
 from app.application.services.base_service import BaseService
+from app.application.services.task_write_buffer import TaskWriteBuffer
 from app.core.error_handling.base_error_handler import BaseErrorHandler
-from app.core.logging import get_logger
-from app.domain.entities.character import Character, CharacterAppearance
-from app.domain.entities.generation_task import GenerationTask, TaskProgress, TaskStatus, TaskType
-from app.domain.entities.panel import Panel, SpeechBubble
-from app.domain.entities.scene import Scene
+from app.domain.constants.art_styles import ensure_art_style_string
+from app.domain.entities.generation_task import GenerationTask, TaskProgress, TaskType
 from app.domain.entities.webtoon import Webtoon
 from app.domain.repositories.task_repository import TaskRepository
 from app.domain.repositories.webtoon_repository import WebtoonRepository
-from app.domain.value_objects.dimensions import PanelDimensions, PanelSize
-from app.domain.value_objects.position import Position
-from app.domain.value_objects.style import StyleConfiguration
+
+if TYPE_CHECKING:
+    # Entities and value objects are only needed by the sync generation path;
+    # they are imported where used so start_*_generation does not load them
+    from app.domain.entities.character import Character
+    from app.domain.entities.panel import Panel
+    from app.domain.value_objects.dimensions import PanelDimensions
+    from app.domain.value_objects.position import Position
+
+_LOGGER = logging.getLogger(__name__)
+
+# Defaults for the fields read from AI-generated scene/character payloads.
+# Values are immutable so the shared defaults can never be mutated through an entity.
+_SCENE_DEFAULTS: Dict[str, Any] = {
+    "visual_description": "",
+    "setting": "",
+    "mood": "",
+    "characters": (),
+    "camera_angle": "medium",
+    "panel_size": "full",
+    "special_effects": (),
+    "dialogue": (),
+}
+_scene_fields = operator.itemgetter(*_SCENE_DEFAULTS)
+
+_CHARACTER_DEFAULTS: Dict[str, Any] = {
+    "name": "Unknown Character",
+    "description": "",
+    "appearance": "",
+    "hair_style": "",
+    "hair_color": "",
+    "eye_color": "",
+    "clothing_style": "",
+    "personality": (),
+    "backstory": "",
+}
+_character_fields = operator.itemgetter(*_CHARACTER_DEFAULTS)
+
+# Shared stand-in for missing list fields in task input data; a tuple serializes
+# as a JSON array like a list but is never mutated, so one instance is enough
+_NO_ITEMS: Tuple[Any, ...] = ()
+
+# Panel sizes accepted by start_panel_generation
+_VALID_PANEL_SIZES = frozenset({"small", "medium", "large", "full"})
+
+# Running generate_webtoon_sync pipelines keyed by (event loop, serialized request),
+# shared module-wide because a service instance is created per request
+_webtoons_in_flight: Dict[Tuple[Any, str], asyncio.Future] = {}
+
+
+def _request_context(request: GenerationRequestDTO) -> Dict[str, Any]:
+    """Log/error context for a webtoon generation request"""
+    return {
+        "prompt_length": len(request.prompt) if request.prompt else 0,
+        "num_panels": request.num_panels,
+        "art_style": str(request.art_style),
+    }
+
+
+def _panel_context(
+    scene_description: str,
+    art_style: str,
+    character_names: Optional[List[str]],
+    panel_size: str,
+) -> Dict[str, Any]:
+    """Log/error context for a panel generation request"""
+    return {
+        "scene_description_length": len(scene_description) if scene_description else 0,
+        "art_style": str(art_style),
+        "character_count": len(character_names) if character_names else 0,
+        "panel_size": panel_size,
+    }
+
+
+def _personality_traits(personality: Any) -> List[str]:
+    """Normalize an AI-generated personality (text, list or mapping) into trait strings"""
+    if isinstance(personality, str):
+        return [personality] if personality else []
+    if isinstance(personality, dict):
+        return [f"{trait}: {detail}" for trait, detail in sorted(personality.items())]
+    return [str(trait) for trait in personality]
+
+
+@functools.lru_cache(maxsize=64)
+def _style_prompt_text(style: str) -> str:
+    """Prompt text for an art style; the style is constant across a webtoon's panels"""
+    from app.domain.value_objects.style import StyleConfiguration
+
+    return StyleConfiguration.for_style(style).to_prompt_text()
+
+
+@functools.lru_cache(maxsize=16)
+def _panel_dimensions(panel_size: str) -> PanelDimensions:
+    """Dimensions for a panel size name; the value object is frozen, so it is shared"""
+    from app.domain.value_objects.dimensions import PanelDimensions, PanelSize
+
+    return PanelDimensions.from_size(PanelSize(panel_size))
+
+
+@functools.lru_cache(maxsize=None)
+def _bubble_positions() -> Tuple[Position, Position]:
+    """Speech bubbles alternate between these (immutable) positions"""
+    from app.domain.value_objects.position import Position
+
+    return (
+        Position.from_named_position("top-left"),
+        Position.from_named_position("top-right"),
+    )
 
 
 def create_generation_service(
@@ -69,6 +179,8 @@ def create_generation_service(
     task_repository: TaskRepository,
     error_handler: Optional[BaseErrorHandler] = None,
     logger: Optional[logging.Logger] = None,
+    task_buffer: Optional[TaskWriteBuffer] = None,
+    max_concurrent_panels: int = 4,
 ) -> 'GenerationService':
     """
     Factory function to create a GenerationService instance with proper dependency injection.
@@ -80,20 +192,21 @@ def create_generation_service(
         task_repository: Repository for tracking generation tasks
         error_handler: Optional error handler instance
         logger: Optional logger instance
+        task_buffer: Optional shared buffer for batching task writes
+        max_concurrent_panels: Maximum panels rendered at once per webtoon
         
     Returns:
         GenerationService: Configured instance of GenerationService
     """
-    if logger is None:
-        logger = get_logger(__name__)
-        
     return GenerationService(
         ai_provider=ai_provider,
         image_generator=image_generator,
         webtoon_repository=webtoon_repository,
         task_repository=task_repository,
         error_handler=error_handler,
-        logger=logger,
+        logger=logger or _LOGGER,
+        task_buffer=task_buffer,
+        max_concurrent_panels=max_concurrent_panels,
     )
 
 
@@ -149,6 +262,8 @@ class GenerationService(BaseService):
         task_repository: TaskRepository,
         error_handler: Optional[BaseErrorHandler] = None,
         logger: Optional[logging.Logger] = None,
+        task_buffer: Optional[TaskWriteBuffer] = None,
+        max_concurrent_panels: int = 4,
     ):
         """
         Initialize the generation service.
@@ -160,13 +275,20 @@ class GenerationService(BaseService):
             task_repository: Repository for tracking generation tasks
             error_handler: Optional error handler instance
             logger: Optional logger instance
+            task_buffer: Optional shared buffer for batching task writes;
+                defaults to one wrapping task_repository
+            max_concurrent_panels: Maximum panels rendered at once per webtoon,
+                to stay within provider rate limits
         """
         # Initialize with the provided logger or create a new one
-        super().__init__(error_handler=error_handler, logger=logger or logging.getLogger(__name__))
+        super().__init__(error_handler=error_handler, logger=logger or _LOGGER)
         self.ai_provider = ai_provider
         self.image_generator = image_generator
         self.webtoon_repository = webtoon_repository
         self.task_repository = task_repository
+        self._task_buffer = task_buffer or TaskWriteBuffer(task_repository)
+        self._image_available: Optional[bool] = None
+        self.max_concurrent_panels = max_concurrent_panels
 
     async def start_webtoon_generation(
         self, request: GenerationRequestDTO
@@ -219,47 +341,24 @@ class GenerationService(BaseService):
             print(f"Started generation task {result.task_id} for webtoon {result.webtoon_id}")
             ```
         """
-        context = {
-            "prompt_length": len(request.prompt) if request.prompt else 0,
-            "num_panels": request.num_panels,
-            "art_style": str(request.art_style),
-        }
-        
         try:
-            self.logger.info(
-                f"Starting webtoon generation with prompt: {request.prompt[:100]}..."
-            )
-            
-            # Import locally to avoid circular imports
-            from app.domain.constants.art_styles import ensure_art_style_string
-            
-            # Create a placeholder webtoon entity first
-            from app.domain.entities.webtoon import Webtoon
-            
-            # Create a placeholder webtoon with minimal information
-            placeholder_webtoon = Webtoon(
-                title=f"Generating: {request.prompt[:30]}...",
-                description=f"Webtoon being generated from prompt: {request.prompt}",
-                art_style=ensure_art_style_string(request.art_style)
-            )
+            self.logger.info("Starting webtoon generation with prompt: %.100s...", request.prompt)
             
-            # Save the placeholder webtoon to get an ID
-            saved_webtoon = await self.webtoon_repository.save(placeholder_webtoon)
-            webtoon_id = saved_webtoon.id
-            
-            self.logger.info(
-                f"Created placeholder webtoon with ID {webtoon_id}",
-                extra={"webtoon_id": webtoon_id}
-            )
+            style_value = ensure_art_style_string(request.art_style)
+
+            # The placeholder's ID is minted up front, so the task can reference
+            # it before anything is written
+            placeholder_webtoon = Webtoon.create_pending(request.prompt, style_value)
+            webtoon_id = placeholder_webtoon.id
             
             # Create the task with the webtoon_id included in input_data
             task = GenerationTask(
                 task_type=TaskType.WEBTOON_GENERATION,
                 input_data={
                     "prompt": request.prompt,
-                    "art_style": ensure_art_style_string(request.art_style),
+                    "art_style": style_value,
                     "num_panels": request.num_panels,
-                    "character_descriptions": request.character_descriptions or [],
+                    "character_descriptions": request.character_descriptions or _NO_ITEMS,
                     "additional_context": request.additional_context,
                     "style_preferences": request.style_preferences or {},
                     "webtoon_id": str(webtoon_id),
@@ -267,9 +366,13 @@ class GenerationService(BaseService):
                 progress=TaskProgress(total_steps=5),  # Story, Characters, Scenes, Images, Assembly
             )
 
-            await self.task_repository.save(task)
-            self.logger.debug(
-                f"Created generation task {task.id} for webtoon {webtoon_id}",
+            # Write the placeholder webtoon and the task concurrently
+            await asyncio.gather(
+                self.webtoon_repository.save(placeholder_webtoon),
+                self._task_buffer.enqueue(task),
+            )
+            self.logger.info(
+                "Created placeholder webtoon %s and generation task %s", webtoon_id, task.id,
                 extra={"task_id": task.id, "webtoon_id": webtoon_id}
             )
 
@@ -282,6 +385,7 @@ class GenerationService(BaseService):
             )
             
         except Exception as e:
+            context = _request_context(request)
             error_msg = f"Failed to start webtoon generation: {str(e)}"
             self.logger.error(error_msg, exc_info=True, extra=context)
             self.handle_error(e, context=context)
@@ -361,25 +465,20 @@ class GenerationService(BaseService):
             print(f"Panel generated at: {result.panel_url}")
             ```
         """
-        context = {
-            "scene_description_length": len(scene_description) if scene_description else 0,
-            "art_style": str(art_style),
-            "character_count": len(character_names) if character_names else 0,
-            "panel_size": panel_size,
-        }
-        
         try:
             self.logger.info(
-                f"Starting panel generation with scene: {scene_description[:100]}..."
+                "Starting panel generation with scene: %.100s...", scene_description
             )
             
-            # Import locally to avoid circular imports
-            from app.domain.constants.art_styles import ensure_art_style_string
-            
+            style_value = ensure_art_style_string(art_style)
+
             # Validate panel size
-            if panel_size not in ["small", "medium", "large", "full"]:
+            if panel_size not in _VALID_PANEL_SIZES:
                 error_msg = f"Invalid panel size: {panel_size}"
-                self.logger.warning(error_msg, extra=context)
+                self.logger.warning(
+                    error_msg,
+                    extra=_panel_context(scene_description, art_style, character_names, panel_size),
+                )
                 raise ValueError(error_msg)
             
             # Create a task for panel generation
@@ -387,8 +486,8 @@ class GenerationService(BaseService):
                 task_type=TaskType.PANEL_GENERATION,
                 input_data={
                     "scene_description": scene_description,
-                    "art_style": ensure_art_style_string(art_style),
-                    "character_names": character_names or [],
+                    "art_style": style_value,
+                    "character_names": character_names or _NO_ITEMS,
                     "panel_size": panel_size,
                     "mood": mood,
                     "prompt": prompt,
@@ -397,38 +496,31 @@ class GenerationService(BaseService):
                 progress=TaskProgress(total_steps=2),  # Scene preparation, Image generation
             )
 
-            await self.task_repository.save(task)
+            await self._task_buffer.enqueue(task)
             self.logger.debug(
-                f"Created panel generation task {task.id}",
+                "Created panel generation task %s", task.id,
                 extra={"task_id": task.id}
             )
 
-            # Prepare request data for Celery task
-            panel_request_data = {
-                "scene_description": scene_description,
-                "art_style": ensure_art_style_string(art_style),
-                "character_names": character_names or [],
-                "panel_size": panel_size,
-                "mood": mood,
-                "prompt": prompt,
-                "style_preferences": style_preferences or {},
-            }
+            # The Celery payload is the task's input data; it is serialized on submit
+            panel_request_data = task.input_data
             
             # Submit task to Celery for async processing
             try:
                 from app.tasks.generation_tasks import start_panel_generation_task
-                start_panel_generation_task.delay(task_id=task.id, request_data=panel_request_data)
+                start_panel_generation_task.delay(task_id=str(task.id), request_data=panel_request_data)
                 self.logger.debug(
-                    f"Submitted panel generation task {task.id} to Celery",
+                    "Submitted panel generation task %s to Celery", task.id,
                     extra={"task_id": task.id}
                 )
             except Exception as e:
                 error_msg = f"Failed to submit Celery task: {str(e)}"
                 self.logger.error(error_msg, exc_info=True)
-                # Update task status to failed
-                task.status = TaskStatus.FAILED
+                # The task was persisted before submitting so the worker can find it;
+                # record the failure on that same record with a single write
+                task.fail(error_msg)
                 task.progress.message = f"Failed to start task: {str(e)}"
-                await self.task_repository.save(task)
+                await self._task_buffer.enqueue(task)
                 raise
             
             return GenerationResultDTO(
@@ -439,6 +531,7 @@ class GenerationService(BaseService):
             )
             
         except Exception as e:
+            context = _panel_context(scene_description, art_style, character_names, panel_size)
             error_msg = f"Failed to start panel generation: {str(e)}"
             self.logger.error(error_msg, exc_info=True, extra=context)
             self.handle_error(e, context=context)
@@ -450,6 +543,9 @@ class GenerationService(BaseService):
         """
         Generate a webtoon synchronously (for testing/development).
         
+        Identical requests that arrive while a generation is running share
+        that generation and receive the same result.
+        
         Args:
             request: The generation request DTO
             
@@ -459,25 +555,53 @@ class GenerationService(BaseService):
         Raises:
             RuntimeError: If webtoon generation fails at any step
         """
-        context = {
-            "prompt_length": len(request.prompt) if request.prompt else 0,
-            "num_panels": request.num_panels,
-            "art_style": str(request.art_style),
-        }
+        key = (asyncio.get_running_loop(), request.model_dump_json())
+        flight = _webtoons_in_flight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._generate_webtoon(request))
+            _webtoons_in_flight[key] = flight
+            flight.add_done_callback(lambda _: _webtoons_in_flight.pop(key, None))
+        else:
+            self.logger.info(
+                "Joining in-flight webtoon generation for identical request",
+                extra={"num_panels": request.num_panels, "art_style": str(request.art_style)}
+            )
+        # Shield so one caller going away does not cancel the others' generation
+        return await asyncio.shield(flight)
+
+    async def _generate_webtoon(
+        self, request: GenerationRequestDTO
+    ) -> Dict[str, Any]:
+        """
+        Run the full webtoon generation pipeline for a request.
+        
+        Args:
+            request: The generation request DTO
+            
+        Returns:
+            Dict containing the generated webtoon details
+            
+        Raises:
+            RuntimeError: If webtoon generation fails at any step
+        """
+        context = _request_context(request)
         
         self.logger.info(
-            f"Starting synchronous webtoon generation: {request.prompt[:100]}...",
+            "Starting synchronous webtoon generation: %.100s...", request.prompt,
             extra=context
         )
 
         try:
-            # Step 1: Generate story structure
-            self.logger.debug("Generating story structure...", extra=context)
+            style_value = ensure_art_style_string(request.art_style)
+
+            # Step 1: Generate story structure and scenes in one provider request
+            self.logger.debug("Generating story structure and scenes...", extra=context)
             try:
-                story_data = await self.ai_provider.generate_story(
+                story_data, scenes_data = await self.ai_provider.generate_story_and_scenes(
                     request.prompt,
-                    request.art_style.value,
+                    style_value,
                     request.additional_context,
+                    request.num_panels,
                 )
                 self.logger.debug("Successfully generated story structure", extra=context)
             except Exception as e:
@@ -487,80 +611,65 @@ class GenerationService(BaseService):
                 raise RuntimeError(f"{error_msg}: {str(e)}") from e
 
             # Step 2: Create webtoon entity
-            try:
-                webtoon = Webtoon(
-                    title=story_data.get("title", "Generated Webtoon"),
-                    description=story_data.get("plot_summary", ""),
-                    art_style=request.art_style,
-                )
-                self.logger.debug("Created webtoon entity", extra=context)
-            except Exception as e:
-                error_msg = "Failed to create webtoon entity"
-                self.logger.error(error_msg, exc_info=True, extra=context)
-                self.handle_error(e, context=context)
-                raise RuntimeError(f"{error_msg}: {str(e)}") from e
+            webtoon = Webtoon(
+                title=story_data.get("title", "Generated Webtoon"),
+                description=story_data.get("plot_summary", ""),
+                art_style=style_value,
+            )
+            self.logger.debug("Created webtoon entity", extra=context)
 
             # Step 3: Create characters
             try:
                 characters_data = story_data.get("main_characters", [])
                 self.logger.info(
-                    f"Creating {len(characters_data)} characters",
+                    "Creating %d characters", len(characters_data),
                     extra={"character_count": len(characters_data), **context}
                 )
-                
-                for i, char_data in enumerate(characters_data, 1):
-                    try:
-                        character = self._create_character_from_data(char_data)
-                        webtoon.add_character(character)
-                        self.logger.debug(
-                            f"Created character {i}/{len(characters_data)}: {character.name}",
-                            extra={"character_name": character.name, **context}
-                        )
-                    except Exception as e:
-                        error_msg = f"Failed to create character from data: {str(char_data)}"
-                        self.logger.warning(error_msg, exc_info=True, extra=context)
-                        # Continue with other characters even if one fails
-                        continue
+                # Parsing is CPU-only; keep it off the event loop
+                webtoon.extend_characters(
+                    await asyncio.to_thread(self._build_characters, characters_data, context)
+                )
             except Exception as e:
                 error_msg = "Failed to process characters"
                 self.logger.error(error_msg, exc_info=True, extra=context)
                 # Continue with generation even if character creation fails
 
-            # Step 4: Generate scenes and panels
+            # Step 4: Build and render panels
             self.logger.info(
-                f"Generating {request.num_panels} panels...",
+                "Generating %d panels...", request.num_panels,
                 extra={"num_panels": request.num_panels, **context}
             )
             
             try:
-                scenes_data = await self.ai_provider.generate_scene_descriptions(
-                    story_data, request.num_panels
+                # Parsing is CPU-only; build every panel in one worker-thread hop
+                panels = await asyncio.to_thread(
+                    self._build_panel_skeletons, scenes_data, style_value, context
                 )
-                
-                for i, scene_data in enumerate(scenes_data, 1):
-                    try:
-                        panel = await self._create_panel_from_scene(
-                            scene_data, webtoon.characters, request.art_style
-                        )
-                        webtoon.add_panel(panel)
+                try:
+                    if not await self._ensure_image_available():
                         self.logger.debug(
-                            f"Generated panel {i}/{len(scenes_data)}",
-                            extra={"panel_index": i, "total_panels": len(scenes_data), **context}
+                            "Image generator not available, skipping image generation", extra=context
                         )
-                    except Exception as e:
-                        error_msg = f"Failed to generate panel {i+1}"
-                        self.logger.warning(error_msg, exc_info=True, extra=context)
-                        # Continue with other panels even if one fails
-                        continue
+                    else:
+                        # One timestamp for the whole batch instead of one clock read per panel
+                        generated_at = datetime.now(UTC)
+                        render_slots = asyncio.Semaphore(self.max_concurrent_panels)
+                        await asyncio.gather(*(
+                            self._render_panel(panel, style_value, generated_at, True, render_slots)
+                            for panel in panels
+                        ))
+                finally:
+                    # Keep the built panels even if rendering fails
+                    webtoon.extend_panels(panels)
             except Exception as e:
-                error_msg = "Failed to generate scenes"
+                error_msg = "Failed to generate panels"
                 self.logger.error(error_msg, exc_info=True, extra=context)
-                # Continue with saving even if scene generation fails
+                # Continue with saving even if panel generation fails
 
             # Step 5: Save webtoon
             saved_webtoon = await self.webtoon_repository.save(webtoon)
             self.logger.info(
-                f"Successfully saved webtoon {saved_webtoon.id}",
+                "Successfully saved webtoon %s", saved_webtoon.id,
                 extra={"webtoon_id": saved_webtoon.id, **context}
             )
             
@@ -590,196 +699,280 @@ class GenerationService(BaseService):
         Raises:
             ValueError: If character data is invalid or missing required fields
         """
+        (
+            name,
+            description,
+            appearance_desc,
+            hair_style,
+            hair_color,
+            eye_color,
+            clothing_style,
+            personality,
+            backstory,
+        ) = _character_fields({**_CHARACTER_DEFAULTS, **char_data})
         context = {
-            "character_name": char_data.get("name", "Unknown"),
+            "character_name": name,
             "data_keys": list(char_data.keys()) if char_data else []
         }
         
+        self.logger.debug("Creating character from data", extra=context)
+
+        if not name:
+            error_msg = "Character name is required"
+            self.logger.warning(error_msg, extra=context)
+            raise ValueError(error_msg)
+
+        # Appearance details are only used when the payload describes an appearance
+        if not appearance_desc:
+            hair_style = hair_color = eye_color = clothing_style = ""
+
         try:
+            from app.domain.entities.character import Character, CharacterAppearance
+
+            character = Character(
+                name=name,
+                description=description,
+                appearance=CharacterAppearance(
+                    hair_style=hair_style,
+                    hair_color=hair_color,
+                    eye_color=eye_color,
+                    clothing_style=clothing_style,
+                ),
+                personality_traits=_personality_traits(personality),
+                backstory=backstory,
+            )
+        except (ValueError, TypeError, AttributeError) as e:
+            # Malformed payload fields end up here
+            error_msg = f"Failed to create character entity: {str(e)}"
+            self.logger.error(
+                error_msg, exc_info=self.logger.isEnabledFor(logging.DEBUG), extra=context
+            )
+            self.handle_error(e, context=context)
+            raise ValueError(f"Invalid character data: {str(e)}") from e
+
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(
-                "Creating character from data",
-                extra={"character_name": char_data.get("name"), **context}
+                "Created appearance for character: %s", name,
+                extra={"character_name": name, "appearance": str(character.appearance)}
             )
-            
-            # Extract basic character information
-            name = char_data.get("name", "Unknown Character")
-            description = char_data.get("description", "")
-            
-            if not name:
-                error_msg = "Character name is required"
-                self.logger.warning(error_msg, extra=context)
-                raise ValueError(error_msg)
+        self.logger.debug(
+            "Successfully created character: %s", name,
+            extra={"character_id": character.id, "character_name": name}
+        )
+        return character
 
-            # Parse appearance if available
-            appearance = CharacterAppearance()
+    def _build_panel_skeletons(
+        self, scenes_data: List[Dict[str, Any]], art_style: str, context: Dict[str, Any]
+    ) -> List[Panel]:
+        """
+        Build panels without images, skipping scenes that fail to parse.
+        
+        Args:
+            scenes_data: Scene payloads from the story structure
+            art_style: The art style to use for the panels
+            context: Logging context
+            
+        Returns:
+            List[Panel]: The panels that were built
+        """
+        panels = []
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for index, scene_data in enumerate(scenes_data, 1):
             try:
-                appearance_desc = char_data.get("appearance", "")
-                if appearance_desc:
-                    # Simple parsing of appearance description
-                    appearance.hair_style = char_data.get("hair_style", "")
-                    appearance.hair_color = char_data.get("hair_color", "")
-                    appearance.eye_color = char_data.get("eye_color", "")
-                    appearance.clothing_style = char_data.get("clothing_style", "")
-                
-                self.logger.debug(
-                    f"Created appearance for character: {name}",
-                    extra={"character_name": name, "appearance": str(appearance)}
-                )
+                panels.append(self._build_panel_skeleton(scene_data, art_style))
             except Exception as e:
-                error_msg = f"Failed to parse character appearance: {str(e)}"
-                self.logger.warning(error_msg, exc_info=True, extra=context)
-                # Continue with default appearance if parsing fails
+                # Tracebacks only at DEBUG: a skipped panel is recoverable
+                self.logger.warning(
+                    "Failed to generate panel %d: %s", index, e,
+                    exc_info=debug, extra=context
+                )
+        return panels
 
-            # Create character with basic info
+    def _build_characters(
+        self, characters_data: List[Dict[str, Any]], context: Dict[str, Any]
+    ) -> List[Character]:
+        """
+        Create character entities, skipping entries that fail to parse.
+        
+        Args:
+            characters_data: Character payloads from the story structure
+            context: Logging context
+            
+        Returns:
+            List[Character]: The characters that were created
+        """
+        characters = []
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        for i, char_data in enumerate(characters_data, 1):
             try:
-                character = Character(
-                    name=name,
-                    description=description,
-                    appearance=appearance,
-                    personality=char_data.get("personality", {}),
-                    backstory=char_data.get("backstory", ""),
+                character = self._create_character_from_data(char_data)
+            except Exception as e:
+                # Continue with other characters even if one fails; one line
+                # without a traceback is enough for a skipped entry
+                self.logger.warning(
+                    "Failed to create character from data: %s", char_data,
+                    extra={"error": repr(e), **context}
                 )
-                
+                continue
+            characters.append(character)
+            if debug:
                 self.logger.debug(
-                    f"Successfully created character: {name}",
-                    extra={"character_id": character.id, "character_name": name}
+                    "Created character %d/%d: %s", i, len(characters_data), character.name,
+                    extra={"character_name": character.name, **context}
                 )
-                
-                return character
-                
-            except Exception as e:
-                error_msg = f"Failed to create character entity: {str(e)}"
-                self.logger.error(error_msg, exc_info=True, extra=context)
-                self.handle_error(e, context=context)
-                raise ValueError(f"Invalid character data: {str(e)}") from e
-                
-        except Exception as e:
-            error_msg = f"Failed to process character data: {str(e)}"
-            self.logger.error(error_msg, exc_info=True, extra=context)
-            self.handle_error(e, context=context)
-            raise
+        return characters
 
-    async def _create_panel_from_scene(
+    def _build_panel_skeleton(
         self,
         scene_data: Dict[str, Any],
-        characters: List[Character],
         art_style: str,
     ) -> Panel:
         """
-        Create a panel entity from scene data.
+        Build a panel with its scene and speech bubbles, without an image.
+        
+        Pure CPU work with no I/O, so it can run in a worker thread.
         
         Args:
             scene_data: Dictionary containing scene description and metadata
-            characters: List of available characters in the webtoon
             art_style: The art style to use for the panel
             
         Returns:
-            Panel: The created panel entity with scene and dialogue
+            Panel: The panel entity with scene and dialogue
             
         Raises:
             ValueError: If scene data is invalid or panel creation fails
         """
+        from app.domain.entities.panel import Panel, SpeechBubble
+        from app.domain.entities.scene import Scene
+
+        (
+            visual_description,
+            setting,
+            mood,
+            scene_characters,
+            camera_angle,
+            panel_size,
+            special_effects,
+            dialogue_data,
+        ) = _scene_fields({**_SCENE_DEFAULTS, **scene_data})
         context = {
-            "scene_characters": len(scene_data.get("characters", [])),
-            "dialogue_items": len(scene_data.get("dialogue", [])),
+            "scene_characters": len(scene_characters),
+            "dialogue_items": len(dialogue_data),
             "art_style": str(art_style),
         }
-        
-        try:
+        # Checked once: the debug records below are skipped entirely when disabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
             self.logger.debug("Creating panel from scene data", extra=context)
-            
-            # Create scene
-            try:
-                scene = Scene(
-                    description=scene_data.get("visual_description", ""),
-                    setting=scene_data.get("setting", ""),
-                    mood=scene_data.get("mood", ""),
-                    character_names=scene_data.get("characters", []),
-                    camera_angle=scene_data.get("camera_angle", "medium"),
-                )
-                self.logger.debug("Created scene for panel", extra=context)
-            except Exception as e:
-                error_msg = "Failed to create scene from data"
-                self.logger.error(error_msg, exc_info=True, extra=context)
-                raise ValueError(f"{error_msg}: {str(e)}") from e
 
-            # Create panel with dimensions
-            try:
-                panel_size = scene_data.get("panel_size", "full")
-                dimensions = PanelDimensions.from_size(PanelSize(panel_size))
-                
-                panel = Panel(
-                    scene=scene,
-                    dimensions=dimensions,
-                    visual_effects=scene_data.get("special_effects", []),
-                )
-                self.logger.debug(
-                    f"Created panel with size {panel_size}",
-                    extra={"width": dimensions.width, "height": dimensions.height, **context}
-                )
-            except Exception as e:
-                error_msg = "Failed to create panel with given dimensions"
-                self.logger.error(error_msg, exc_info=True, extra=context)
-                raise ValueError(f"{error_msg}: {str(e)}") from e
+        try:
+            scene = Scene(
+                description=visual_description,
+                setting=setting,
+                mood=mood,
+                character_names=list(scene_characters),
+                camera_angle=camera_angle,
+            )
+            dimensions = _panel_dimensions(panel_size)
+            panel = Panel(
+                scene=scene,
+                dimensions=dimensions,
+                visual_effects=list(special_effects),
+            )
+        except (ValueError, TypeError, AttributeError) as e:
+            error_msg = f"Failed to create panel from scene: {str(e)}"
+            self.logger.error(error_msg, exc_info=debug, extra=context)
+            self.handle_error(e, context=context)
+            raise ValueError(error_msg) from e
 
-            # Add speech bubbles from dialogue
+        if debug:
+            self.logger.debug(
+                "Created panel with size %s", panel_size,
+                extra={"width": dimensions.width, "height": dimensions.height, **context}
+            )
+            self.logger.debug(
+                "Adding %d speech bubbles", len(dialogue_data),
+                extra={"dialogue_count": len(dialogue_data), **context}
+            )
+
+        # Add speech bubbles from dialogue; bad entries are skipped, not fatal
+        bubbles = []
+        # Simple positioning - alternate sides
+        for i, (line, position) in enumerate(
+            zip(dialogue_data, itertools.cycle(_bubble_positions())), 1
+        ):
             try:
-                dialogue_data = scene_data.get("dialogue", [])
-                self.logger.debug(
-                    f"Adding {len(dialogue_data)} speech bubbles",
-                    extra={"dialogue_count": len(dialogue_data), **context}
+                if isinstance(line, dict):
+                    character_name, text = line.get("character", "Character"), line.get("text", "")
+                else:
+                    character_name, text = "Character", str(line)
+                bubbles.append(SpeechBubble(
+                    character_name=character_name,
+                    text=text,
+                    position=position
+                ))
+            except (ValueError, TypeError) as e:
+                self.logger.warning(
+                    "Failed to add speech bubble %d", i,
+                    extra={"error": repr(e), **context}
                 )
-                
-                for i, dialogue in enumerate(dialogue_data):
-                    try:
-                        if isinstance(dialogue, dict):
-                            character_name = dialogue.get("character", "Character")
-                            text = dialogue.get("text", "")
-                        else:
-                            character_name = "Character"
-                            text = str(dialogue)
-
-                        # Simple positioning - alternate sides
-                        position = Position.from_named_position(
-                            "top-left" if i % 2 == 0 else "top-right"
-                        )
+        panel.extend_speech_bubbles(bubbles)
 
-                        bubble = SpeechBubble(
-                            character_name=character_name, 
-                            text=text, 
-                            position=position
-                        )
-                        panel.add_speech_bubble(bubble)
-                        
-                    except Exception as e:
-                        error_msg = f"Failed to add speech bubble {i+1}"
-                        self.logger.warning(error_msg, exc_info=True, extra=context)
-                        continue  # Skip this bubble but continue with others
-                        
-            except Exception as e:
-                error_msg = "Failed to process dialogue"
-                self.logger.error(error_msg, exc_info=True, extra=context)
-                # Continue without dialogue if processing fails
+        return panel
+            
+    async def _ensure_image_available(self) -> bool:
+        """
+        Probe the image generator once and cache the result.
+        
+        Returns:
+            bool: Whether panel images can be generated
+        """
+        if self._image_available is None:
+            available = False
+            if self.image_generator and hasattr(self.image_generator, 'is_available'):
+                available = self.image_generator.is_available()
+                # Providers may implement the check as a coroutine
+                if inspect.isawaitable(available):
+                    available = await available
+            self._image_available = bool(available)
+        return self._image_available
 
-            # Generate image if image generator is available
-            if self.image_generator and hasattr(self.image_generator, 'is_available') and self.image_generator.is_available():
-                await self._generate_panel_image(panel, art_style, context)
+    async def _render_panel(
+        self,
+        panel: Panel,
+        art_style: str,
+        generated_at: Optional[datetime] = None,
+        image_available: Optional[bool] = None,
+        slots: Optional[asyncio.Semaphore] = None,
+    ) -> None:
+        """
+        Generate the panel image if an image generator is available.
+        
+        Args:
+            panel: The panel to render
+            art_style: The art style to use for generation
+            generated_at: Timestamp to stamp on the panel; defaults to now
+            image_available: Result of the availability probe, if already known
+            slots: Optional semaphore bounding concurrent renders
+        """
+        context = {"panel_id": str(panel.id), "art_style": str(art_style)}
+        if image_available is None:
+            image_available = await self._ensure_image_available()
+        if image_available:
+            if slots is None:
+                await self._generate_panel_image(panel, art_style, context, generated_at)
             else:
-                self.logger.debug("Image generator not available, skipping image generation", extra=context)
+                async with slots:
+                    await self._generate_panel_image(panel, art_style, context, generated_at)
+        else:
+            self.logger.debug("Image generator not available, skipping image generation", extra=context)
 
-            return panel
-            
-        except Exception as e:
-            error_msg = f"Failed to create panel from scene: {str(e)}"
-            self.logger.error(error_msg, exc_info=True, extra=context)
-            self.handle_error(e, context=context)
-            raise
-            
     async def _generate_panel_image(
         self,
         panel: Panel,
         art_style: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        generated_at: Optional[datetime] = None,
     ) -> None:
         """
         Generate an image for the panel using the configured image generator.
@@ -788,7 +981,9 @@ class GenerationService(BaseService):
             panel: The panel to generate an image for
             art_style: The art style to use for generation
             context: Logging context
+            generated_at: Timestamp to stamp on the panel; defaults to now
         """
+        debug = self.logger.isEnabledFor(logging.DEBUG)
         try:
             # Ensure art_style is a string
             art_style_str = (
@@ -797,18 +992,17 @@ class GenerationService(BaseService):
                 else getattr(art_style, 'value', str(art_style))
             )
             
-            self.logger.debug(
-                "Generating panel image",
-                extra={"art_style": art_style_str, **context}
-            )
-            
-            style_config = StyleConfiguration.for_style(art_style_str)
+            if debug:
+                self.logger.debug(
+                    "Generating panel image",
+                    extra={"art_style": art_style_str, **context}
+                )
             
             # Enhance the visual description
             enhanced_prompt = await self.ai_provider.enhance_visual_description(
                 panel.scene.get_prompt_description(),
                 art_style_str,
-                {"style_config": style_config.to_prompt_text()},
+                {"style_config": _style_prompt_text(art_style_str)},
             )
             
             # Generate the image
@@ -821,18 +1015,20 @@ class GenerationService(BaseService):
             
             # Update panel with generated image
             panel.image_url = public_url
-            panel.generated_at = datetime.now(UTC)
+            panel.generated_at = generated_at or datetime.now(UTC)
             
-            self.logger.debug(
-                "Successfully generated panel image",
-                extra={
-                    "image_url": public_url,
-                    "local_path": str(local_path),
-                    **context
-                }
-            )
+            if debug:
+                self.logger.debug(
+                    "Successfully generated panel image",
+                    extra={
+                        "image_url": public_url,
+                        "local_path": str(local_path),
+                        **context
+                    }
+                )
             
         except Exception as e:
-            error_msg = f"Failed to generate panel image: {str(e)}"
-            self.logger.warning(error_msg, exc_info=True, extra=context)
+            self.logger.warning(
+                "Failed to generate panel image: %s", e, exc_info=debug, extra=context
+            )
             # Don't fail the whole panel creation if image generation fails
@@ -3,14 +3,15 @@ Room management service for WebSocket connections.
 
 This service handles room creation, participant management, and room state.
 """
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Set, Tuple
+from datetime import UTC, datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from fastapi import WebSocket
 
-from app.websocket.connection_manager import ConnectionManager
+from app.websocket.connection_manager import ConnectionManager, try_encode_message
 from app.websocket.exceptions import WebSocketError, WebSocketValidationError
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,9 @@ class RoomService:
             connection_manager: Optional connection manager for sending messages
         """
         self.connection_manager = connection_manager or ConnectionManager()
-        self.rooms: Dict[str, Set[str]] = {}  # room_id -> set of client_ids
+        # room_id -> {client_id: websocket}; the socket is None when the client joined
+        # without one, and messages then go through the connection manager
+        self.rooms: Dict[str, Dict[str, Optional[WebSocket]]] = {}
         self.client_rooms: Dict[str, str] = {}  # client_id -> room_id
         self.room_metadata: Dict[str, Dict] = {}  # room_id -> metadata
 
@@ -50,7 +53,7 @@ class RoomService:
         if room_id in self.rooms:
             raise WebSocketError(f"Room {room_id} already exists", code="room_exists")
             
-        self.rooms[room_id] = set()
+        self.rooms[room_id] = {}
         self.room_metadata[room_id] = metadata or {}
         logger.info(f"Created room {room_id}")
         return room_id
@@ -83,7 +86,7 @@ class RoomService:
                 code="already_in_room"
             )
             
-        self.rooms[room_id].add(client_id)
+        self.rooms[room_id][client_id] = websocket
         self.client_rooms[client_id] = room_id
         logger.info(f"Client {client_id} joined room {room_id}")
         
@@ -107,7 +110,7 @@ class RoomService:
             return None
             
         if room_id in self.rooms:
-            self.rooms[room_id].discard(client_id)
+            self.rooms[room_id].pop(client_id, None)
             
             # Notify other participants before potentially removing the room
             await self._notify_room_change(room_id, "participant_left", {
@@ -142,21 +145,74 @@ class RoomService:
         """
         if room_id not in self.rooms:
             return
-            
-        for client_id in self.rooms[room_id]:
-            if client_id == exclude_client:
-                continue
-                
-            try:
-                await self.connection_manager.send_personal_message(message, client_id)
-            except Exception as e:
-                logger.error(f"Error sending message to client {client_id}: {str(e)}")
-
-    async def get_room_info(self, room_id: str) -> dict:
+
+        # Snapshot the recipients: clients may join or leave while sends are awaited
+        recipients = tuple(
+            (client_id, websocket)
+            for client_id, websocket in self.rooms[room_id].items()
+            if client_id != exclude_client
+        )
+        # Encode once for every participant with a known socket
+        payload = None
+        if any(websocket is not None for _, websocket in recipients):
+            payload = try_encode_message(message, f"room {room_id}")
+            if payload is None:
+                return
+        # Send to everyone concurrently so one slow client does not delay the rest
+        results = await asyncio.gather(
+            *(
+                self._send(message, payload, client_id, websocket)
+                for client_id, websocket in recipients
+            ),
+            return_exceptions=True,
+        )
+        for (client_id, _), result in zip(recipients, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending message to client {client_id}: {str(result)}")
+
+    async def _send(
+        self,
+        message: dict,
+        payload: Optional[str],
+        client_id: str,
+        websocket: Optional[WebSocket]
+    ) -> None:
+        """Send a message to one room participant.
+        
+        Sends the pre-encoded payload to the client's current connection;
+        clients that joined without a socket go through the manager.
+        
+        Args:
+            message: The message to send
+            payload: The encoded message; set whenever websocket is not None
+            client_id: The ID of the recipient
+            websocket: The socket the recipient joined with, if any
+        """
+        if websocket is None:
+            await self.connection_manager.send_personal_message(message, client_id)
+            return
+        # A client that reconnected under the same ID has a new socket in the
+        # manager, and one the manager dropped is gone; never use the join-time socket
+        active_connections = self.connection_manager.active_connections
+        websocket = active_connections.get(client_id)
+        if websocket is None:
+            return
+        try:
+            await websocket.send_text(payload)
+        except Exception:
+            # Same cleanup the connection manager does for a broken socket, but
+            # never tear down a newer connection that replaced this one
+            if active_connections.get(client_id) is websocket:
+                await self.connection_manager.disconnect(client_id)
+            raise
+
+    async def get_room_info(self, room_id: str, include_participants: bool = True) -> dict:
         """Get information about a room.
         
         Args:
             room_id: The ID of the room
+            include_participants: Whether to list the participant IDs; callers
+                that only need the count can skip copying them
             
         Returns:
             Dictionary containing room information
@@ -164,13 +220,15 @@ class RoomService:
         if room_id not in self.rooms:
             return {"exists": False}
             
-        return {
+        info = {
             "exists": True,
             "room_id": room_id,
             "participant_count": len(self.rooms[room_id]),
-            "participants": list(self.rooms[room_id]),
             "metadata": self.room_metadata.get(room_id, {})
         }
+        if include_participants:
+            info["participants"] = list(self.rooms[room_id])
+        return info
 
     async def get_client_room(self, client_id: str) -> Optional[str]:
         """Get the room ID for a client.
@@ -198,12 +256,19 @@ class RoomService:
             data: Additional data to include in the notification
             exclude_client: Optional client ID to exclude from the notification
         """
+        # Nobody to tell (empty room, or only the client that caused the change):
+        # skip building the notification and its timestamp
+        participants = self.rooms.get(room_id)
+        if not participants or participants.keys() == {exclude_client}:
+            return
+
         notification = {
             "type": "room_update",
             "room_id": room_id,
             "event": change_type,
             "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            # orjson writes the ISO 8601 string while encoding the message
+            "timestamp": datetime.now(UTC)
         }
         await self.broadcast_to_room(room_id, notification, exclude_client=exclude_client)
 
@@ -3,7 +3,7 @@
 Scene processing service
 """
 import logging
-from typing import Dict, List
+from typing import Dict, FrozenSet, List
 
 from app.application.interfaces.ai_provider import AIProvider
 from app.domain.entities.character import Character
@@ -11,6 +11,14 @@ from app.domain.entities.scene import Scene
 
 logger = logging.getLogger(__name__)
 
+# Lighting that suits each mood; moods not listed accept any lighting
+_MOOD_LIGHTING: Dict[str, FrozenSet[str]] = {
+    "happy": frozenset({"bright", "natural", "warm"}),
+    "sad": frozenset({"dim", "soft", "cool"}),
+    "tense": frozenset({"dramatic", "harsh", "dark"}),
+    "mysterious": frozenset({"dark", "dramatic", "moody"}),
+}
+
 
 class SceneService:
     """Service for scene processing and enhancement"""
@@ -48,10 +56,13 @@ class SceneService:
         self, characters: List[Character], scene_character_names: List[str]
     ) -> Dict[str, str]:
         """Build character context for scene enhancement"""
+        # Index once so each scene character is a dict lookup, not a list scan;
+        # built in reverse so the first character with a name wins, as before
+        by_name = {c.name: c for c in reversed(characters)}
         context = {}
 
         for char_name in scene_character_names:
-            character = next((c for c in characters if c.name == char_name), None)
+            character = by_name.get(char_name)
             if character:
                 context[char_name] = character.get_full_description()
             else:
@@ -77,18 +88,13 @@ class SceneService:
 
         # Check mood consistency
         if scene.mood and scene.lighting:
-            mood_lighting_map = {
-                "happy": ["bright", "natural", "warm"],
-                "sad": ["dim", "soft", "cool"],
-                "tense": ["dramatic", "harsh", "dark"],
-                "mysterious": ["dark", "dramatic", "moody"],
-            }
-
-            if scene.mood in mood_lighting_map:
-                recommended_lighting = mood_lighting_map[scene.mood]
-                if scene.lighting not in recommended_lighting:
-                    issues.append(
-                        f"Lighting '{scene.lighting}' may not match mood '{scene.mood}'"
-                    )
+            recommended_lighting = _MOOD_LIGHTING.get(scene.mood)
+            if (
+                recommended_lighting is not None
+                and scene.lighting not in recommended_lighting
+            ):
+                issues.append(
+                    f"Lighting '{scene.lighting}' may not match mood '{scene.mood}'"
+                )
 
         return issues
@@ -0,0 +1,63 @@
+# app/application/services/webtoon_loader.py
+"""
+Batched loading of webtoons.
+
+Requests that edit or render a webtoon each start by looking it up. Concurrent
+lookups are coalesced into a single ``WebtoonRepository.get_by_ids`` call, and
+lookups of the same webtoon in one batch share one entity.
+"""
+import logging
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from app.application.services.batcher import Batcher
+from app.domain.entities.webtoon import Webtoon
+from app.domain.repositories.webtoon_repository import WebtoonRepository
+
+logger = logging.getLogger(__name__)
+
+
+class WebtoonLoader:
+    """Queue webtoon lookups and read them from the repository in batches"""
+
+    def __init__(
+        self,
+        repository: WebtoonRepository,
+        max_batch_size: int = 32,
+        flush_interval: float = 0.005,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            repository: Repository used to read batches
+            max_batch_size: Read as soon as this many lookups are queued
+            flush_interval: Seconds to wait for more lookups when several arrive together
+        """
+        self.repository = repository
+        self._batcher: Batcher[UUID, Optional[Webtoon]] = Batcher(
+            self._flush, max_batch_size, flush_interval, name="webtoon lookups"
+        )
+
+    async def load(self, webtoon_id: UUID) -> Optional[Webtoon]:
+        """
+        Queue a lookup and wait until its batch has been read.
+
+        Args:
+            webtoon_id: ID of the webtoon to load
+
+        Returns:
+            Optional[Webtoon]: The webtoon, or None if it does not exist
+
+        Raises:
+            Exception: Whatever the repository raised while reading the batch
+        """
+        return await self._batcher.submit(webtoon_id)
+
+    async def _flush(self, webtoon_ids: List[UUID]) -> List[Optional[Webtoon]]:
+        """Read one batch of webtoons, one result per requested ID"""
+        # dict.fromkeys drops duplicate IDs while keeping their order
+        unique_ids = list(dict.fromkeys(webtoon_ids))
+        webtoons: Dict[UUID, Webtoon] = await self.repository.get_by_ids(unique_ids)
+        logger.debug("Loaded %s of %s webtoons", len(webtoons), len(unique_ids))
+        return [webtoons.get(webtoon_id) for webtoon_id in webtoon_ids]
@@ -2,19 +2,49 @@
 """
 Webtoon business logic service
 """
+import asyncio
+import html
 import logging
-from typing import Any, Dict, List, Optional, Protocol
+import operator
+from itertools import starmap
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from app.application.dto.webtoon_dto import CharacterDTO, PanelDTO, WebtoonDTO
+from app.application.dto.webtoon_dto import CharacterDTO, DialogueDTO, PanelDTO, WebtoonDTO
 from app.application.services.base_service import BaseService
+from app.application.services.webtoon_loader import WebtoonLoader
 from app.core.error_handling.base_error_handler import BaseErrorHandler
-from app.domain.entities.character import Character
+from app.domain.entities.character import Character, CharacterAppearance
 from app.domain.entities.panel import Panel
+from app.domain.entities.scene import Scene
 from app.domain.entities.webtoon import Webtoon
 from app.domain.repositories.webtoon_repository import WebtoonRepository
+from app.domain.value_objects.dimensions import PanelDimensions, PanelSize
 from app.utils.webtoon_renderer import WebtoonRenderer
 
+# Reads both dialogue fields of a speech bubble in one C-level call
+_bubble_dialogue = operator.attrgetter("character_name", "text")
+
+# Listings larger than this are mapped to DTOs in a worker thread so a big
+# result set does not stall other requests on the event loop
+_THREADED_MAPPING_THRESHOLD = 256
+
+# Page wrapper for rendered webtoons; filled with str.format
+_HTML_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+        {css}
+    </style>
+</head>
+<body>
+    {body}
+</body>
+</html>"""
+
 
 class WebtoonDTOMapper:
     """Mapper for converting between webtoon entities and DTOs"""
@@ -27,8 +57,8 @@ class WebtoonDTOMapper:
             title=webtoon.title,
             description=webtoon.description,
             art_style=webtoon.art_style,
-            panels=[WebtoonDTOMapper.panel_to_dto(p) for p in webtoon.panels],
-            characters=[WebtoonDTOMapper.character_to_dto(c) for c in webtoon.characters],
+            panels=tuple(map(WebtoonDTOMapper.panel_to_dto, webtoon.panels)),
+            characters=tuple(map(WebtoonDTOMapper.character_to_dto, webtoon.characters)),
             created_at=webtoon.created_at,
             updated_at=webtoon.updated_at,
             is_published=webtoon.is_published,
@@ -44,42 +74,25 @@ class WebtoonDTOMapper:
             name=character.name,
             description=character.description,
             appearance_description=character.appearance.to_description(),
-            personality_traits=character.personality_traits,
+            personality_traits=list(character.personality_traits),
             role=character.role,
         )
 
     @staticmethod
     def panel_to_dto(panel: Panel) -> PanelDTO:
         """Convert panel entity to DTO"""
-        dialogue = [
-            {"character": bubble.character_name, "text": bubble.text}
-            for bubble in panel.speech_bubbles
-        ]
-
         return PanelDTO(
             id=panel.id,
             sequence_number=panel.sequence_number,
             scene_description=panel.scene.get_prompt_description(),
             character_names=panel.get_characters_in_panel(),
-            dialogue=dialogue,
-            visual_effects=panel.visual_effects,
+            dialogue=tuple(starmap(DialogueDTO, map(_bubble_dialogue, panel.speech_bubbles))),
+            visual_effects=list(panel.visual_effects),
             image_url=panel.image_url,
             generated_at=panel.generated_at,
         )
 
 
-class WebtoonRenderer(Protocol):
-    """Protocol for webtoon rendering implementations"""
-    
-    def render_webtoon(self, webtoon: Webtoon) -> str:
-        """Render a webtoon to HTML"""
-        ...
-        
-    def render_css_styles(self) -> str:
-        """Render CSS styles for webtoon"""
-        ...
-
-
 class WebtoonService(BaseService):
     """Service for webtoon business operations"""
 
@@ -88,7 +101,8 @@ class WebtoonService(BaseService):
         repository: WebtoonRepository, 
         renderer: WebtoonRenderer,
         error_handler: Optional[BaseErrorHandler] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        loader: Optional[WebtoonLoader] = None,
     ):
         """Initialize the webtoon service.
         
@@ -97,11 +111,13 @@ class WebtoonService(BaseService):
             renderer: The renderer for generating webtoon output
             error_handler: Optional error handler instance
             logger: Optional logger instance
+            loader: Optional shared loader for batching webtoon lookups
         """
         # Initialize with the provided logger or create a new one
         super().__init__(error_handler=error_handler, logger=logger or logging.getLogger(__name__))
         self.repository = repository
         self.renderer = renderer
+        self._loader = loader or WebtoonLoader(repository)
         self.dto_mapper = WebtoonDTOMapper()
 
     async def create_webtoon(
@@ -122,12 +138,12 @@ class WebtoonService(BaseService):
             ValueError: If the webtoon data is invalid
         """
         try:
-            self.logger.info(f"Creating new webtoon with title: {title}")
+            self.logger.info("Creating new webtoon with title: %s", title)
             webtoon = Webtoon(title=title, description=description, art_style=art_style)
             # Save the webtoon using the repository's save method
-            saved_webtoon = await self.repository.save(webtoon)
-            self.logger.info(f"Successfully created webtoon with ID: {saved_webtoon.id}")
-            return self.dto_mapper.to_dto(saved_webtoon)
+            await self.repository.save(webtoon)
+            self.logger.info("Successfully created webtoon with ID: %s", webtoon.id)
+            return self.dto_mapper.to_dto(webtoon)
         except Exception as e:
             error_context = {
                 "title": title,
@@ -148,11 +164,11 @@ class WebtoonService(BaseService):
             Optional[WebtoonDTO]: The webtoon DTO if found, None otherwise
         """
         try:
-            self.logger.debug(f"Retrieving webtoon with ID: {webtoon_id}")
-            webtoon = await self.repository.get_by_id(webtoon_id)
+            self.logger.debug("Retrieving webtoon with ID: %s", webtoon_id)
+            webtoon = await self._loader.load(webtoon_id)
             if webtoon:
                 return self.dto_mapper.to_dto(webtoon)
-            self.logger.warning(f"Webtoon not found with ID: {webtoon_id}")
+            self.logger.warning("Webtoon not found with ID: %s", webtoon_id)
             return None
         except Exception as e:
             self.handle_error(e, context={"webtoon_id": str(webtoon_id)})
@@ -185,21 +201,26 @@ class WebtoonService(BaseService):
             ValueError: If character data is invalid
         """
         try:
-            self.logger.info(f"Adding character '{name}' to webtoon ID: {webtoon_id}")
-            webtoon = await self.repository.get_by_id(webtoon_id)
+            self.logger.info("Adding character '%s' to webtoon ID: %s", name, webtoon_id)
+            character = Character(
+                name=name,
+                description=description,
+                appearance=CharacterAppearance(**appearance_data),
+                personality_traits=list(personality_traits),
+                role=role,
+            )
+            webtoon = await self.repository.mutate(
+                webtoon_id, lambda webtoon: webtoon.add_character(character)
+            )
             if not webtoon:
-                self.logger.warning(f"Webtoon not found with ID: {webtoon_id}")
+                self.logger.warning("Webtoon not found with ID: %s", webtoon_id)
                 return None
-                
-            character = Character.create(name, description, appearance_data, personality_traits, role)
-            webtoon.add_character(character)
-            
-            updated_webtoon = await self.repository.update(webtoon.id, webtoon)
+
             self.logger.info(
-                f"Successfully added character '{name}' (ID: {character.id}) "
-                f"to webtoon ID: {webtoon_id}"
+                "Successfully added character '%s' (ID: %s) to webtoon ID: %s",
+                name, character.id, webtoon_id
             )
-            return self.dto_mapper.to_dto(updated_webtoon)
+            return self.dto_mapper.to_dto(webtoon)
             
         except Exception as e:
             error_context = {
@@ -215,7 +236,7 @@ class WebtoonService(BaseService):
         webtoon_id: UUID, 
         scene_description: str,
         character_names: List[str],
-        panel_size: str = "medium"
+        panel_size: str = "full"
     ) -> Optional[WebtoonDTO]:
         """
         Add a panel to a webtoon
@@ -224,7 +245,7 @@ class WebtoonService(BaseService):
             webtoon_id: The ID of the webtoon to add the panel to
             scene_description: Description of the panel's scene
             character_names: List of character names in the panel
-            panel_size: Size of the panel (small, medium, large)
+            panel_size: Size of the panel (full, half, third, quarter)
             
         Returns:
             Optional[WebtoonDTO]: The updated webtoon DTO, or None if webtoon not found
@@ -233,19 +254,24 @@ class WebtoonService(BaseService):
             ValueError: If panel data is invalid
         """
         try:
-            self.logger.info(f"Adding panel to webtoon ID: {webtoon_id}")
-            webtoon = await self.repository.get_by_id(webtoon_id)
+            self.logger.info("Adding panel to webtoon ID: %s", webtoon_id)
+            panel = Panel(
+                scene=Scene(
+                    description=scene_description, character_names=list(character_names)
+                ),
+                dimensions=PanelDimensions.from_size(PanelSize(panel_size)),
+            )
+            webtoon = await self.repository.mutate(
+                webtoon_id, lambda webtoon: webtoon.add_panel(panel)
+            )
             if not webtoon:
-                self.logger.warning(f"Webtoon not found with ID: {webtoon_id}")
+                self.logger.warning("Webtoon not found with ID: %s", webtoon_id)
                 return None
-                
-            panel = webtoon.add_panel(scene_description, character_names, panel_size)
-            
-            updated_webtoon = await self.repository.update(webtoon.id, webtoon)
+
             self.logger.info(
-                f"Successfully added panel (ID: {panel.id}) to webtoon ID: {webtoon_id}"
+                "Successfully added panel (ID: %s) to webtoon ID: %s", panel.id, webtoon_id
             )
-            return self.dto_mapper.to_dto(updated_webtoon)
+            return self.dto_mapper.to_dto(webtoon)
             
         except Exception as e:
             error_context = {
@@ -270,16 +296,14 @@ class WebtoonService(BaseService):
             ValueError: If webtoon cannot be published (e.g., missing required fields)
         """
         try:
-            self.logger.info(f"Publishing webtoon ID: {webtoon_id}")
-            webtoon = await self.repository.get_by_id(webtoon_id)
+            self.logger.info("Publishing webtoon ID: %s", webtoon_id)
+            webtoon = await self.repository.mutate(webtoon_id, Webtoon.publish)
             if not webtoon:
-                self.logger.warning(f"Webtoon not found with ID: {webtoon_id}")
+                self.logger.warning("Webtoon not found with ID: %s", webtoon_id)
                 return None
-                
-            webtoon.publish()
-            updated_webtoon = await self.repository.update(webtoon.id, webtoon)
-            self.logger.info(f"Successfully published webtoon ID: {webtoon_id}")
-            return self.dto_mapper.to_dto(updated_webtoon)
+
+            self.logger.info("Successfully published webtoon ID: %s", webtoon_id)
+            return self.dto_mapper.to_dto(webtoon)
             
         except Exception as e:
             self.handle_error(e, context={"webtoon_id": str(webtoon_id)})
@@ -288,7 +312,7 @@ class WebtoonService(BaseService):
     async def get_all_webtoons(self) -> List[WebtoonDTO]:
         """Get all webtoons"""
         webtoons = await self.repository.get_all()
-        return [self.dto_mapper.to_dto(w) for w in webtoons]
+        return await self._to_dtos(webtoons)
 
     async def search_webtoons(self, keyword: str) -> List[WebtoonDTO]:
         """
@@ -301,14 +325,20 @@ class WebtoonService(BaseService):
             List[WebtoonDTO]: List of matching webtoon DTOs
         """
         try:
-            self.logger.info(f"Searching webtoons for keyword: '{keyword}'")
-            webtoons = await self.repository.search(keyword)
-            self.logger.debug(f"Found {len(webtoons)} webtoons matching keyword: '{keyword}'")
-            return [self.dto_mapper.to_dto(webtoon) for webtoon in webtoons]
+            self.logger.info("Searching webtoons for keyword: '%s'", keyword)
+            webtoons = await self.repository.search_by_keyword(keyword)
+            self.logger.debug("Found %d webtoons matching keyword: '%s'", len(webtoons), keyword)
+            return await self._to_dtos(webtoons)
         except Exception as e:
             self.handle_error(e, context={"search_keyword": keyword})
             raise
 
+    async def _to_dtos(self, webtoons: List[Webtoon]) -> List[WebtoonDTO]:
+        """Map webtoons to DTOs, off the event loop for large listings"""
+        if len(webtoons) > _THREADED_MAPPING_THRESHOLD:
+            return await asyncio.to_thread(list, map(self.dto_mapper.to_dto, webtoons))
+        return list(map(self.dto_mapper.to_dto, webtoons))
+
     async def get_webtoon_html_content(self, webtoon_id: UUID) -> Optional[str]:
         """
         Get HTML content for rendering a webtoon
@@ -321,37 +351,23 @@ class WebtoonService(BaseService):
         """
         try:
             # First get the webtoon entity
-            webtoon = await self.repository.get_by_id(webtoon_id)
+            webtoon = await self._loader.load(webtoon_id)
             if not webtoon:
-                self.logger.warning(f"Webtoon {webtoon_id} not found")
+                self.logger.warning("Webtoon %s not found", webtoon_id)
                 return None
                 
             # Use the renderer to generate HTML
             html_content = self.renderer.render_webtoon(webtoon)
             
-            # Add CSS styles
-            css_styles = self.renderer.render_css_styles()
-            full_html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>{webtoon.title}</title>
-                <style>
-                    {css_styles}
-                </style>
-            </head>
-            <body>
-                {html_content}
-            </body>
-            </html>
-            """
-            
-            return full_html.strip()
+            # Wrap it in a page with the CSS styles
+            return _HTML_PAGE.format(
+                title=html.escape(webtoon.title),
+                css=self.renderer.render_css_styles(),
+                body=html_content,
+            )
             
         except Exception as e:
-            self.logger.error(f"Error generating HTML for webtoon {webtoon_id}: {str(e)}", exc_info=True)
+            self.logger.error("Error generating HTML for webtoon %s: %s", webtoon_id, e, exc_info=True)
             raise
 
 
@@ -359,7 +375,8 @@ def get_webtoon_service(
     repository: WebtoonRepository,
     renderer: WebtoonRenderer,
     error_handler: Optional[BaseErrorHandler] = None,
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    loader: Optional[WebtoonLoader] = None,
 ) -> WebtoonService:
     """
     Factory function to create a WebtoonService instance.
@@ -369,6 +386,7 @@ def get_webtoon_service(
         renderer: The renderer for generating webtoon output
         error_handler: Optional error handler instance
         logger: Optional logger instance
+        loader: Optional shared loader for batching webtoon lookups
         
     Returns:
         WebtoonService: A configured instance of WebtoonService
@@ -377,6 +395,7 @@ def get_webtoon_service(
         repository=repository,
         renderer=renderer,
         error_handler=error_handler,
-        logger=logger
+        logger=logger,
+        loader=loader,
     )
 
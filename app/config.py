@@ -2,6 +2,7 @@
 """
 Configuration management for SketchDojo backend
 """
+import json
 from functools import lru_cache
 from typing import Optional
 
@@ -12,9 +13,6 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
 
-    # Define the model config with env var prefixes and env file settings
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
-
     # Application
     app_name: str = Field(default="SketchDojo API")
     app_version: str = Field(default="2.0.0")
@@ -59,6 +57,7 @@ class Settings(BaseSettings):
     default_image_width: int = Field(default=1024)
     default_image_height: int = Field(default=1024)
     generation_timeout: int = Field(default=300)  # seconds
+    max_concurrent_panel_renders: int = Field(default=4)  # per webtoon, bounds image/AI fan-out
 
     # Monitoring
     enable_metrics: bool = Field(default=True)
@@ -83,30 +82,29 @@ class Settings(BaseSettings):
         if isinstance(v, list):
             return tuple(v)
         elif isinstance(v, str):
-            # Handle comma-separated string like "http://localhost:3000,http://example.com"
-            if ',' in v:
-                return tuple(origin.strip() for origin in v.split(','))
-            # Handle JSON-formatted string array like '["http://localhost:3000"]'
-            elif v.startswith('[') and v.endswith(']'):
-                try:
-                    import json
-                    origins = json.loads(v)
-                    if isinstance(origins, list):
-                        return tuple(origins)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-            # Single origin as string
-            return (v,)
+            return _parse_cors_origins(v)
         return v
 
 
+@lru_cache(maxsize=8)
+def _parse_cors_origins(value: str) -> tuple[str, ...]:
+    """Parse a CORS origins string into a tuple of origins"""
+    # Handle JSON-formatted string array like '["http://localhost:3000"]'
+    if value.startswith('[') and value.endswith(']'):
+        try:
+            origins = json.loads(value)
+            if isinstance(origins, list):
+                return tuple(origins)
+        except (json.JSONDecodeError, TypeError):
+            pass
+    # Handle comma-separated string like "http://localhost:3000,http://example.com"
+    if ',' in value:
+        return tuple(origin.strip() for origin in value.split(','))
+    # Single origin as string
+    return (value,)
+
+
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached settings instance"""
-    import os
-    
-    # Check if we're in a test environment
-    is_testing = "PYTEST_CURRENT_TEST" in os.environ
-    
-    # Create settings with test defaults when in test environment
     return Settings()
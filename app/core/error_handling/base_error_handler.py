@@ -13,6 +13,8 @@ from typing import Any, Dict, Optional, Type, TypeVar, Callable, Awaitable, Gene
 T = TypeVar('T')
 E = TypeVar('E', bound=Exception)
 
+_MISSING = object()
+
 class BaseErrorHandler(Generic[E]):
     """
     Base class for error handlers that provides common error handling functionality.
@@ -73,14 +75,19 @@ class BaseErrorHandler(Generic[E]):
             context: Optional context about where the error occurred
             include_details: Whether to include full error details in the log
         """
-        log_message = f"Error: {str(error)}"
-        if context:
-            log_message = f"{log_message} (context: {context})"
-            
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         if include_details or not isinstance(error, self.default_error_type):
-            self.logger.exception(log_message)
+            log = self.logger.exception
+        else:
+            log = self.logger.error
+
+        # str(error) and the context repr are only built if the record is emitted
+        if context:
+            log("Error: %s (context: %s)", error, context)
         else:
-            self.logger.error(log_message)
+            log("Error: %s", error)
     
     def format_error(
         self,
@@ -101,8 +108,12 @@ class BaseErrorHandler(Generic[E]):
                 "code": getattr(error, "code", "error"),
                 "message": str(error),
             }
-            if include_details or hasattr(error, "details"):
-                error_dict["details"] = getattr(error, "details", {})
+            # One probe for details instead of hasattr() followed by getattr()
+            details = getattr(error, "details", _MISSING)
+            if details is not _MISSING:
+                error_dict["details"] = details
+            elif include_details:
+                error_dict["details"] = {}
             return error_dict
             
         # For unexpected errors, return a generic error message
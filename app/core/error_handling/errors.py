@@ -5,27 +5,38 @@ from typing import Any, Dict, List, Optional, Union
 
 
 class AppError(Exception):
-    """Base class for all application-specific exceptions."""
+    """Base class for all application-specific exceptions.
+    
+    Subclasses declare their ``error_code`` and ``status_code`` as class
+    attributes; passing either to ``__init__`` overrides it for one instance.
+    """
+    
+    error_code: Optional[str] = None
+    status_code: int = 500
     
     def __init__(
         self, 
         message: str = "An error occurred",
         error_code: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
-        status_code: int = 500,
+        status_code: Optional[int] = None,
     ):
         """Initialize the error.
         
         Args:
             message: Human-readable error message
-            error_code: Machine-readable error code
+            error_code: Machine-readable error code (defaults to the class's code, then its name)
             details: Additional error details
-            status_code: HTTP status code
+            status_code: HTTP status code (defaults to the class's status code)
         """
         self.message = message
-        self.error_code = error_code or self.__class__.__name__
+        if error_code is not None:
+            self.error_code = error_code
+        elif self.error_code is None:
+            self.error_code = self.__class__.__name__
+        if status_code is not None:
+            self.status_code = status_code
         self.details = details or {}
-        self.status_code = status_code
         super().__init__(self.message)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -42,6 +53,9 @@ class AppError(Exception):
 class BadRequestError(AppError):
     """Raised when the request is malformed or contains invalid data."""
     
+    error_code = "BAD_REQUEST"
+    status_code = 400
+    
     def __init__(self, message: str = "Invalid request", details: Optional[Dict[str, Any]] = None):
         """Initialize the bad request error.
         
@@ -51,15 +65,16 @@ class BadRequestError(AppError):
         """
         super().__init__(
             message=message,
-            error_code="BAD_REQUEST",
-            details=details or {},
-            status_code=400,
+            details=details,
         )
 
 
 class InternalServerError(AppError):
     """Raised when an unexpected error occurs on the server."""
     
+    error_code = "INTERNAL_SERVER_ERROR"
+    status_code = 500
+    
     def __init__(self, message: str = "Internal server error", details: Optional[Dict[str, Any]] = None):
         """Initialize the internal server error.
         
@@ -69,15 +84,16 @@ class InternalServerError(AppError):
         """
         super().__init__(
             message=message,
-            error_code="INTERNAL_SERVER_ERROR",
-            details=details or {},
-            status_code=500,
+            details=details,
         )
 
 
 class ValidationError(AppError):
     """Raised when input validation fails."""
     
+    error_code = "VALIDATION_ERROR"
+    status_code = 400
+    
     def __init__(
         self, 
         message: str = "Validation failed",
@@ -97,15 +113,16 @@ class ValidationError(AppError):
             
         super().__init__(
             message=message,
-            error_code="VALIDATION_ERROR",
             details=details,
-            status_code=400,
         )
 
 
 class NotFoundError(AppError):
     """Raised when a resource is not found."""
     
+    error_code = "NOT_FOUND"
+    status_code = 404
+    
     def __init__(
         self, 
         resource: str = "Resource",
@@ -131,51 +148,49 @@ class NotFoundError(AppError):
             
         super().__init__(
             message=message,
-            error_code="NOT_FOUND",
             details=details,
-            status_code=404,
         )
 
 
 class UnauthorizedError(AppError):
     """Raised when authentication is required but not provided or invalid."""
     
+    error_code = "UNAUTHORIZED"
+    status_code = 401
+    
     def __init__(self, message: str = "Authentication required"):
         """Initialize the unauthorized error."""
-        super().__init__(
-            message=message,
-            error_code="UNAUTHORIZED",
-            status_code=401,
-        )
+        super().__init__(message=message)
 
 
 class ForbiddenError(AppError):
     """Raised when the user doesn't have permission to access a resource."""
     
+    error_code = "FORBIDDEN"
+    status_code = 403
+    
     def __init__(self, message: str = "Permission denied"):
         """Initialize the forbidden error."""
-        super().__init__(
-            message=message,
-            error_code="FORBIDDEN",
-            status_code=403,
-        )
+        super().__init__(message=message)
 
 
 class ConflictError(AppError):
     """Raised when a resource conflict occurs (e.g., duplicate entry)."""
     
+    error_code = "CONFLICT"
+    status_code = 409
+    
     def __init__(self, message: str = "Resource already exists"):
         """Initialize the conflict error."""
-        super().__init__(
-            message=message,
-            error_code="CONFLICT",
-            status_code=409,
-        )
+        super().__init__(message=message)
 
 
 class RateLimitError(AppError):
     """Raised when rate limiting is applied."""
     
+    error_code = "RATE_LIMIT_EXCEEDED"
+    status_code = 429
+    
     def __init__(
         self, 
         message: str = "Rate limit exceeded",
@@ -193,15 +208,16 @@ class RateLimitError(AppError):
             
         super().__init__(
             message=message,
-            error_code="RATE_LIMIT_EXCEEDED",
             details=details,
-            status_code=429,
         )
 
 
 class ServiceUnavailableError(AppError):
     """Raised when a required service is unavailable."""
     
+    error_code = "SERVICE_UNAVAILABLE"
+    status_code = 503
+    
     def __init__(
         self, 
         service: str = "Service",
@@ -218,31 +234,27 @@ class ServiceUnavailableError(AppError):
             
         super().__init__(
             message=message,
-            error_code="SERVICE_UNAVAILABLE",
             details={"service": service},
-            status_code=503,
         )
 
 
 class BadGatewayError(AppError):
     """Raised when an invalid response is received from an upstream server."""
     
+    error_code = "BAD_GATEWAY"
+    status_code = 502
+    
     def __init__(self, message: str = "Bad gateway"):
         """Initialize the bad gateway error."""
-        super().__init__(
-            message=message,
-            error_code="BAD_GATEWAY",
-            status_code=502,
-        )
+        super().__init__(message=message)
 
 
 class GatewayTimeoutError(AppError):
     """Raised when a request to an upstream server times out."""
     
+    error_code = "GATEWAY_TIMEOUT"
+    status_code = 504
+    
     def __init__(self, message: str = "Gateway timeout"):
         """Initialize the gateway timeout error."""
-        super().__init__(
-            message=message,
-            error_code="GATEWAY_TIMEOUT",
-            status_code=504,
-        )
+        super().__init__(message=message)
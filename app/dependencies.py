@@ -3,6 +3,8 @@
 Dependency injection configuration for FastAPI
 """
 
+from functools import lru_cache
+
 import redis.asyncio as redis
 from fastapi import Depends
 
@@ -12,7 +14,9 @@ from app.application.interfaces.storage_provider import StorageProvider
 from app.application.services.chat_service import ChatService
 from app.application.services.character_service import CharacterService
 from app.application.services.generation_service import GenerationService, create_generation_service
+from app.application.services.task_write_buffer import TaskWriteBuffer
 from app.application.services.scene_service import SceneService
+from app.application.services.webtoon_loader import WebtoonLoader
 from app.application.services.webtoon_service import WebtoonService
 from app.config import Settings, get_settings
 from app.domain.repositories.chat_repository import ChatRepository
@@ -27,14 +31,17 @@ from app.infrastructure.storage.file_storage import FileStorage
 from app.utils.webtoon_renderer import WebtoonRenderer
 
 
+@lru_cache()
 def get_redis_client(
     settings: Settings = Depends(get_settings),
 ) -> redis.Redis:
-    """Get Redis client instance"""
+    """Get the process-wide Redis client so requests share one connection pool"""
     return redis.from_url(
         settings.redis_url,
         max_connections=settings.redis_max_connections,
         decode_responses=True,
+        socket_keepalive=True,
+        health_check_interval=30,
     )
 
 
@@ -71,10 +78,16 @@ def create_storage_provider(settings: Settings) -> StorageProvider:
         return FileStorage(settings.file_storage_path)
 
 
+@lru_cache()
 def get_storage_provider(
     settings: Settings = Depends(get_settings),
 ) -> StorageProvider:
-    """Get storage provider instance as a FastAPI dependency"""
+    """Get the process-wide storage provider as a FastAPI dependency
+
+    Redis storage owns a connection pool, so building one per request would open
+    fresh connections every time. Celery tasks run on their own event loops and
+    call create_storage_provider directly instead.
+    """
     return create_storage_provider(settings)
 
 
@@ -101,6 +114,20 @@ def get_task_repository(
     return TaskRepository(storage, mapper=TaskDataMapper())
 
 
+@lru_cache()
+def get_task_write_buffer() -> TaskWriteBuffer:
+    """Get the process-wide task write buffer so concurrent requests share batches"""
+    storage = get_storage_provider(get_settings())
+    return TaskWriteBuffer(get_task_repository(storage))
+
+
+@lru_cache()
+def get_webtoon_loader() -> WebtoonLoader:
+    """Get the process-wide webtoon loader so concurrent requests share lookups"""
+    storage = get_storage_provider(get_settings())
+    return WebtoonLoader(get_webtoon_repository(storage))
+
+
 def get_webtoon_renderer() -> WebtoonRenderer:
     """Get webtoon renderer instance"""
     return WebtoonRenderer()
@@ -109,9 +136,10 @@ def get_webtoon_renderer() -> WebtoonRenderer:
 def get_webtoon_service(
     repository: WebtoonRepository = Depends(get_webtoon_repository),
     renderer: WebtoonRenderer = Depends(get_webtoon_renderer),
+    loader: WebtoonLoader = Depends(get_webtoon_loader),
 ) -> WebtoonService:
     """Get webtoon service instance"""
-    return WebtoonService(repository=repository, renderer=renderer)
+    return WebtoonService(repository=repository, renderer=renderer, loader=loader)
 
 
 def get_scene_service(
@@ -133,6 +161,7 @@ def get_generation_service(
     image_generator: ImageGenerator = Depends(get_image_generator),
     webtoon_repository: WebtoonRepository = Depends(get_webtoon_repository),
     task_repository: TaskRepository = Depends(get_task_repository),
+    task_buffer: TaskWriteBuffer = Depends(get_task_write_buffer),
 ) -> GenerationService:
     """
     Get generation service instance using the factory function.
@@ -145,6 +174,8 @@ def get_generation_service(
         image_generator=image_generator,
         webtoon_repository=webtoon_repository,
         task_repository=task_repository,
+        task_buffer=task_buffer,
+        max_concurrent_panels=get_settings().max_concurrent_panel_renders,
     )
 
 
@@ -204,7 +235,7 @@ async def get_chat_handler_for_websocket() -> ChatHandler:
     
     if not handler.chat_service:
         # Get chat service manually
-        storage_provider = create_storage_provider(get_settings())
+        storage_provider = get_storage_provider(get_settings())
         chat_repo = ChatRepositoryRedis(storage=storage_provider)
         ai_provider = get_ai_provider(get_settings())
         webtoon_repo = get_webtoon_repository(storage_provider)
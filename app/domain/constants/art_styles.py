@@ -4,6 +4,7 @@ Centralized definition of art styles to ensure consistency across the applicatio
 This file is the single source of truth for art style definitions.
 """
 from enum import Enum
+from functools import lru_cache
 from typing import Literal, List, Final
 
 # Define the list of valid art styles
@@ -18,6 +19,9 @@ VALID_ART_STYLES: Final[List[str]] = [
     "painting"  # Added to maintain backward compatibility
 ]
 
+# Lower-cased lookup set for validating style strings
+_VALID_ART_STYLES_LOWER: Final[frozenset] = frozenset(s.lower() for s in VALID_ART_STYLES)
+
 # Define ArtStyle as a Literal type for better type checking and JSON serialization
 ArtStyle = Literal[
     "webtoon",
@@ -58,6 +62,15 @@ class ArtStyleEnum(str, Enum):
             return value
         return value.value
 
+@lru_cache(maxsize=64)
+def _normalize_art_style_name(art_style: str) -> str:
+    """Lower-case and validate a style name; inputs come from a small fixed set"""
+    normalized = art_style.lower()
+    if normalized in _VALID_ART_STYLES_LOWER:
+        return normalized
+    raise ValueError(f"'{art_style}' is not a valid art style")
+
+
 # Helper function to ensure art_style is always a string
 def ensure_art_style_string(art_style) -> str:
     """
@@ -72,9 +85,7 @@ def ensure_art_style_string(art_style) -> str:
     Returns a string or raises ValueError for invalid styles.
     """
     if isinstance(art_style, str):
-        if art_style.lower() in [s.lower() for s in VALID_ART_STYLES]:
-            return art_style.lower()
-        raise ValueError(f"'{art_style}' is not a valid art style")
+        return _normalize_art_style_name(art_style)
     
     if isinstance(art_style, ArtStyleEnum):
         return art_style.value
@@ -84,7 +95,7 @@ def ensure_art_style_string(art_style) -> str:
     
     # Final fallback
     art_style_str = str(art_style)
-    if art_style_str.lower() in [s.lower() for s in VALID_ART_STYLES]:
+    if art_style_str.lower() in _VALID_ART_STYLES_LOWER:
         return art_style_str.lower()
     
     raise ValueError(f"'{art_style_str}' is not a valid art style")
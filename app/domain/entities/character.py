@@ -7,7 +7,7 @@ from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterAppearance:
     """Character appearance description"""
 
@@ -40,7 +40,7 @@ class CharacterAppearance:
         return ", ".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """
     Character entity representing a webtoon character
@@ -4,7 +4,7 @@ Panel domain entity
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID, uuid4
 
 from app.domain.entities.scene import Scene
@@ -12,7 +12,7 @@ from app.domain.value_objects.dimensions import PanelDimensions
 from app.domain.value_objects.position import Position
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeechBubble:
     """Speech bubble within a panel"""
 
@@ -30,7 +30,7 @@ class SpeechBubble:
             raise ValueError("Text is required for speech bubble")
 
 
-@dataclass
+@dataclass(slots=True)
 class Panel:
     """
     Panel entity representing a single webtoon panel
@@ -50,6 +50,10 @@ class Panel:
         """Add a speech bubble to the panel"""
         self.speech_bubbles.append(bubble)
 
+    def extend_speech_bubbles(self, bubbles: Iterable[SpeechBubble]) -> None:
+        """Add several speech bubbles to the panel in order"""
+        self.speech_bubbles.extend(bubbles)
+
     def remove_speech_bubble(self, bubble_id: UUID) -> bool:
         """Remove a speech bubble by ID"""
         for i, bubble in enumerate(self.speech_bubbles):
@@ -68,9 +72,13 @@ class Panel:
         return [bubble.text for bubble in self.speech_bubbles]
 
     def get_characters_in_panel(self) -> List[str]:
-        """Get unique character names in this panel"""
-        characters = set(self.scene.character_names)
-        characters.update(bubble.character_name for bubble in self.speech_bubbles)
+        """Get unique character names in this panel, scene characters first"""
+        # dict keys dedupe like a set but keep first-seen order, so repeated
+        # serializations of the same panel list names identically
+        characters = dict.fromkeys(self.scene.character_names)
+        characters.update(
+            dict.fromkeys(bubble.character_name for bubble in self.speech_bubbles)
+        )
         return list(characters)
 
     @property
@@ -7,7 +7,7 @@ from typing import Dict, List
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Scene:
     """
     Scene entity representing the visual content of a panel
@@ -4,7 +4,7 @@ Webtoon domain entity
 """
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from uuid import UUID, uuid4
 
 from app.domain.entities.character import Character
@@ -29,12 +29,34 @@ class Webtoon:
     is_published: bool = False
     metadata: dict = field(default_factory=dict)
 
+    @classmethod
+    def create_pending(cls, prompt: str, art_style: str) -> "Webtoon":
+        """
+        Create the placeholder for a webtoon that is about to be generated.
+
+        The ID is minted here, so callers can reference the webtoon before it is stored.
+        """
+        return cls(
+            id=uuid4(),
+            title=f"Generating: {prompt[:30]}...",
+            description=f"Webtoon being generated from prompt: {prompt}",
+            art_style=art_style,
+        )
+
     def add_panel(self, panel: Panel) -> None:
         """Add a panel to the webtoon"""
         panel.sequence_number = len(self.panels)
         self.panels.append(panel)
         self.updated_at = datetime.now(UTC)
 
+    def extend_panels(self, panels: Iterable[Panel]) -> None:
+        """Add several panels to the webtoon in order"""
+        start = len(self.panels)
+        self.panels.extend(panels)
+        for sequence_number in range(start, len(self.panels)):
+            self.panels[sequence_number].sequence_number = sequence_number
+        self.updated_at = datetime.now(UTC)
+
     def remove_panel(self, panel_id: UUID) -> bool:
         """Remove a panel by ID"""
         for i, panel in enumerate(self.panels):
@@ -52,6 +74,16 @@ class Webtoon:
         self.characters.append(character)
         self.updated_at = datetime.now(UTC)
 
+    def extend_characters(self, characters: Iterable[Character]) -> None:
+        """Add several characters to the webtoon in order"""
+        self.characters.extend(characters)
+        self.updated_at = datetime.now(UTC)
+
+    def publish(self) -> None:
+        """Mark the webtoon as published"""
+        self.is_published = True
+        self.updated_at = datetime.now(UTC)
+
     def get_panel_by_id(self, panel_id: UUID) -> Optional[Panel]:
         """Get a panel by its ID"""
         return next((panel for panel in self.panels if panel.id == panel_id), None)
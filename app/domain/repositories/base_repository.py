@@ -2,8 +2,9 @@
 """
 Base repository for data access operations
 """
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 from uuid import UUID
 
 T = TypeVar("T")  # Generic type for entity
@@ -14,12 +15,35 @@ class BaseRepository(Generic[T], ABC):
 
     @abstractmethod
     async def save(self, entity: T) -> T:
-        """Save an entity (create or update)"""
+        """Save an entity (create or update); returns the same instance, not a re-read copy"""
+
+    async def save_many(self, entities: List[T]) -> List[T]:
+        """Save several entities; repositories with a bulk write should override"""
+        return list(await asyncio.gather(*(self.save(entity) for entity in entities)))
 
     @abstractmethod
     async def get_by_id(self, entity_id: UUID) -> Optional[T]:
         """Get entity by ID"""
 
+    async def get_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, T]:
+        """Get several entities keyed by ID; repositories with a bulk read should override"""
+        entities = await asyncio.gather(
+            *(self.get_by_id(entity_id) for entity_id in entity_ids)
+        )
+        return {
+            entity_id: entity
+            for entity_id, entity in zip(entity_ids, entities)
+            if entity is not None
+        }
+
+    async def mutate(self, entity_id: UUID, mutator: Callable[[T], Any]) -> Optional[T]:
+        """Load an entity, apply ``mutator`` to it in place and save it; None if not found"""
+        entity = await self.get_by_id(entity_id)
+        if entity is None:
+            return None
+        mutator(entity)
+        return await self.save(entity)
+
     @abstractmethod
     async def get_all(self, skip: int = 0, limit: int = 100, **filters) -> List[T]:
         """Get all entities with optional pagination and filtering"""
@@ -40,6 +40,21 @@ class TaskRepository(BaseRepository[GenerationTask]):
         except Exception as e:
             logger.error(f"Error saving task {entity.id}: {str(e)}")
             raise
+
+    async def save_many(self, entities: List[GenerationTask]) -> List[GenerationTask]:
+        """Save several task entities with a single storage write"""
+        if not entities:
+            return []
+        try:
+            items = {self._get_key(entity.id): self.mapper.to_dict(entity) for entity in entities}
+            success = await self.storage.store_many(items)
+            if not success:
+                raise RuntimeError(f"Failed to save {len(entities)} tasks")
+            logger.debug(f"Saved {len(entities)} tasks")
+            return entities
+        except Exception as e:
+            logger.error(f"Error saving {len(entities)} tasks: {str(e)}")
+            raise
             
     def save_sync(self, entity: GenerationTask) -> GenerationTask:
         """Save a task entity synchronously (for Celery tasks)"""
@@ -35,10 +35,10 @@ class WebtoonRepository(BaseRepository[Webtoon]):
             success = await self.storage.store(key, data)
             if not success:
                 raise RuntimeError(f"Failed to save webtoon {entity.id}")
-            logger.debug(f"Saved webtoon: {entity.id}")
+            logger.debug("Saved webtoon: %s", entity.id)
             return entity
         except Exception as e:
-            logger.error(f"Error saving webtoon {entity.id}: {str(e)}")
+            logger.error("Error saving webtoon %s: %s", entity.id, e)
             raise
 
     def save_sync(self, entity: Webtoon) -> Webtoon:
@@ -56,10 +56,10 @@ class WebtoonRepository(BaseRepository[Webtoon]):
                 
             if not success:
                 raise RuntimeError(f"Failed to save webtoon {entity.id}")
-            logger.debug(f"Saved webtoon: {entity.id} synchronously")
+            logger.debug("Saved webtoon: %s synchronously", entity.id)
             return entity
         except Exception as e:
-            logger.error(f"Error saving webtoon {entity.id} synchronously: {str(e)}")
+            logger.error("Error saving webtoon %s synchronously: %s", entity.id, e)
             raise
 
     async def get_by_id(self, entity_id: UUID) -> Optional[Webtoon]:
@@ -71,44 +71,59 @@ class WebtoonRepository(BaseRepository[Webtoon]):
                 return None
             return self.mapper.from_dict(data)
         except Exception as e:
-            logger.error(f"Error retrieving webtoon {entity_id}: {str(e)}")
+            logger.error("Error retrieving webtoon %s: %s", entity_id, e)
             return None
             
+    async def get_by_ids(self, entity_ids: List[UUID]) -> Dict[UUID, Webtoon]:
+        """Get several webtoons with a single storage read"""
+        if not entity_ids:
+            return {}
+        try:
+            values = await self.storage.retrieve_many([self._get_key(entity_id) for entity_id in entity_ids])
+            return {
+                entity_id: self.mapper.from_dict(data)
+                for entity_id, data in zip(entity_ids, values)
+                if data is not None
+            }
+        except Exception as e:
+            logger.error("Error retrieving %s webtoons: %s", len(entity_ids), e)
+            return {}
+
     def get_by_id_sync(self, entity_id: UUID) -> Optional[Webtoon]:
         """Get webtoon by ID synchronously (for Celery tasks)"""
         try:
             key = self._get_key(entity_id)
-            logger.info(f"Attempting to retrieve webtoon with key: {key} (ID: {entity_id})")
+            logger.info("Attempting to retrieve webtoon with key: %s (ID: %s)", key, entity_id)
             
             # Check if the storage exists correctly
             if self.storage is None:
-                logger.error(f"Storage provider is None when retrieving webtoon {entity_id}")
+                logger.error("Storage provider is None when retrieving webtoon %s", entity_id)
                 return None
                 
             # List keys to check if the webtoon exists
             if hasattr(self.storage, 'list_keys_sync'):
                 all_keys = self.storage.list_keys_sync(f"{self.key_prefix}*")
-                logger.info(f"Available webtoon keys: {all_keys}")
+                logger.info("Available webtoon keys: %s", all_keys)
                 if key not in all_keys:
-                    logger.warning(f"Key {key} not found in storage")
+                    logger.warning("Key %s not found in storage", key)
             
             # Check if the storage provider has sync methods
             if hasattr(self.storage, 'retrieve_sync'):
-                logger.info(f"Using synchronous retrieve_sync for webtoon {entity_id}")
+                logger.info("Using synchronous retrieve_sync for webtoon %s", entity_id)
                 data = self.storage.retrieve_sync(key)
             else:
                 # Fallback to regular retrieve for non-async providers
-                logger.info(f"Falling back to async retrieve for webtoon {entity_id} (could cause issues in Celery)")
+                logger.info("Falling back to async retrieve for webtoon %s (could cause issues in Celery)", entity_id)
                 data = self.storage.retrieve(key)
                 
             if data is None:
-                logger.warning(f"No data found for webtoon {entity_id} with key {key}")
+                logger.warning("No data found for webtoon %s with key %s", entity_id, key)
                 return None
             
-            logger.info(f"Successfully retrieved webtoon data with key {key}")
+            logger.info("Successfully retrieved webtoon data with key %s", key)
             return self.mapper.from_dict(data)
         except Exception as e:
-            logger.error(f"Error retrieving webtoon {entity_id} synchronously: {str(e)}")
+            logger.error("Error retrieving webtoon %s synchronously: %s", entity_id, e)
             return None
 
     async def update_fields(self, entity_id: UUID, data: Dict[str, Any]) -> Optional[Webtoon]:
@@ -129,9 +144,10 @@ class WebtoonRepository(BaseRepository[Webtoon]):
         """Get all webtoons with optional pagination and filtering"""
         try:
             keys = await self.storage.list_keys(f"{self.key_prefix}*")
+            # Read the whole page in one storage call instead of one per key
+            values = await self.storage.retrieve_many(keys[skip:skip+limit])
             webtoons = []
-            for key in keys[skip:skip+limit]:
-                data = await self.storage.retrieve(key)
+            for data in values:
                 if data is not None:
                     webtoon = self.mapper.from_dict(data)
                     
@@ -148,7 +164,7 @@ class WebtoonRepository(BaseRepository[Webtoon]):
                     webtoons.append(webtoon)
             return webtoons
         except Exception as e:
-            logger.error(f"Error retrieving all webtoons: {str(e)}")
+            logger.error("Error retrieving all webtoons: %s", e)
             return []
 
     async def delete(self, entity_id: UUID) -> bool:
@@ -157,7 +173,7 @@ class WebtoonRepository(BaseRepository[Webtoon]):
             key = self._get_key(entity_id)
             return await self.storage.delete(key)
         except Exception as e:
-            logger.error(f"Error deleting webtoon {entity_id}: {str(e)}")
+            logger.error("Error deleting webtoon %s: %s", entity_id, e)
             return False
 
     async def exists(self, entity_id: UUID) -> bool:
@@ -166,7 +182,7 @@ class WebtoonRepository(BaseRepository[Webtoon]):
             key = self._get_key(entity_id)
             return await self.storage.exists(key)
         except Exception as e:
-            logger.error(f"Error checking webtoon existence {entity_id}: {str(e)}")
+            logger.error("Error checking webtoon existence %s: %s", entity_id, e)
             return False
 
     async def get_by_title(self, title: str) -> Optional[Webtoon]:
@@ -180,11 +196,20 @@ class WebtoonRepository(BaseRepository[Webtoon]):
 
     async def search_by_keyword(self, keyword: str) -> List[Webtoon]:
         """Search webtoons by keyword in title or description"""
-        webtoons = await self.get_all()
-        keyword_lower = keyword.lower()
-        return [
-            w
-            for w in webtoons
-            if keyword_lower in w.title.lower()
-            or keyword_lower in w.description.lower()
-        ]
+        try:
+            keys = await self.storage.list_keys(f"{self.key_prefix}*")
+            values = await self.storage.retrieve_many(keys)
+            keyword_lower = keyword.lower()
+            # Match on the stored fields so only hits are mapped to entities
+            return [
+                self.mapper.from_dict(data)
+                for data in values
+                if isinstance(data, dict)
+                and (
+                    keyword_lower in (data.get("title") or "").lower()
+                    or keyword_lower in (data.get("description") or "").lower()
+                )
+            ]
+        except Exception as e:
+            logger.error("Error searching webtoons for %r: %s", keyword, e)
+            return []
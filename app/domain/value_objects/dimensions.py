@@ -16,7 +16,7 @@ class PanelSize(Enum):
     CUSTOM = "custom"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PanelDimensions:
     """Panel dimensions and layout configuration"""
 
@@ -4,7 +4,7 @@ OpenAI provider implementation
 """
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from openai import AsyncOpenAI
 
@@ -100,6 +100,50 @@ class OpenAIProvider(AIProvider):
         scenes_data = json.loads(content)
         return SceneDataNormalizer.normalize(scenes_data.get("scenes", []))
 
+    @ai_operation
+    async def generate_story_and_scenes(
+        self,
+        prompt: str,
+        style: str,
+        additional_context: Optional[str],
+        num_panels: int,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Generate the story and its scene descriptions with a single completion"""
+        # Get prompts
+        system_prompt = self.templates.get_story_and_scenes_prompt(style)
+        user_prompt = self.templates.format_story_and_scenes_request(
+            prompt, additional_context, num_panels
+        )
+
+        # Call OpenAI API
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            response_format={"type": "json_object"},
+        )
+
+        # Parse and normalize response
+        content = response.choices[0].message.content
+        data = json.loads(content)
+        story = data.get("story")
+        scenes = data.get("scenes")
+        if not isinstance(story, dict) or not isinstance(scenes, list):
+            # The model ignored the combined schema; make the two separate calls
+            # rather than build a webtoon from a placeholder story
+            logger.warning(
+                "Combined story response is missing story or scenes, "
+                "falling back to separate calls"
+            )
+            return await super().generate_story_and_scenes(
+                prompt, style, additional_context, num_panels
+            )
+        return StoryDataNormalizer.normalize(story), SceneDataNormalizer.normalize(scenes)
+
     @ai_operation
     async def generate_dialogue(
         self, scene_description: str, character_names: List[str], mood: str
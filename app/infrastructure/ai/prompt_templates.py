@@ -55,6 +55,50 @@ For each scene, provide:
 
 Focus on visual storytelling that works well in webtoon format.
 Respond with JSON: {"scenes": [scene_objects]}
+"""
+
+    def get_story_and_scenes_prompt(self, style: str) -> str:
+        """Get system prompt for generating a story and its scenes in one response"""
+        return f"""
+You are a professional {style} story writer and visual storyteller. Your task is to create a story outline and break it into detailed scene descriptions for webtoon panels.
+
+Respond only with valid JSON following this exact structure:
+{{
+  "story": {{
+    "title": "A compelling title for the story",
+    "plot_summary": "A concise summary of the main plot",
+    "setting": {{
+      "location": "Where the story takes place",
+      "time_period": "When the story takes place",
+      "atmosphere": "Overall feel of the setting"
+    }},
+    "main_characters": [
+      {{
+        "name": "Character name",
+        "description": "Character description and appearance",
+        "role": "protagonist/antagonist/supporting"
+      }}
+    ],
+    "theme": "The main theme or message",
+    "mood": "Overall mood/tone of the story",
+    "key_scenes": ["List of key visual moments for panels"]
+  }},
+  "scenes": [
+    {{
+      "visual_description": "Detailed description of what should be visually depicted",
+      "characters": ["Names of the characters present in the scene"],
+      "dialogue": [{{"character": "name", "text": "dialogue"}}],
+      "setting": "Specific location/environment details",
+      "mood": "Emotional tone of the scene",
+      "panel_size": "full, half, third or quarter",
+      "camera_angle": "close-up, medium, wide, bird's-eye, etc.",
+      "special_effects": ["Visual effects like speed lines, etc."]
+    }}
+  ]
+}}
+
+Write the story first, then break it into scenes that follow its plot.
+Focus on visual storytelling that works well in webtoon format.
 """
 
     def get_dialogue_generation_prompt(self) -> str:
@@ -112,6 +156,16 @@ Create scenes that:
 Ensure scenes flow logically from one to the next and tell the complete story.
 """
 
+    def format_story_and_scenes_request(
+        self, prompt: str, additional_context: Optional[str], num_panels: int
+    ) -> str:
+        """Format a combined story and scene generation request"""
+        return (
+            self.format_story_request(prompt, additional_context)
+            + f"\n\nThen create {num_panels} detailed scene descriptions for webtoon panels "
+            "that follow the story's plot, include its key characters and tell the complete story."
+        )
+
     def format_dialogue_request(
         self, scene_description: str, character_names: List[str], mood: str
     ) -> str:
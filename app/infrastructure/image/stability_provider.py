@@ -55,7 +55,7 @@ class StabilityProvider(ImageGenerator):
         style: str = "webtoon",
     ) -> Tuple[str, str]:
         """Generate an image from a prompt"""
-        logger.debug(f"StabilityProvider.generate_image called with prompt: {prompt[:30]}..., style: {style}")
+        logger.debug("StabilityProvider.generate_image called with prompt: %.30s..., style: %s", prompt, style)
         
         is_available = await self.is_available()
         if not is_available:
@@ -68,7 +68,7 @@ class StabilityProvider(ImageGenerator):
             style_modifiers = self._get_style_modifiers(style)
             logger.debug(f"Style modifiers for {style}: {style_modifiers}")
             enhanced_prompt = await self.enhance_prompt(prompt, style_modifiers)
-            logger.debug(f"Enhanced prompt: {enhanced_prompt[:50]}...")
+            logger.debug("Enhanced prompt: %.50s...", enhanced_prompt)
 
             headers = {
                 "Content-Type": "application/json",
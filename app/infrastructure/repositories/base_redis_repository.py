@@ -1,6 +1,7 @@
 """
 Base Redis repository implementation with common CRUD operations.
 """
+import asyncio
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -60,7 +61,9 @@ class BaseRedisRepository(BaseRepository[T], ABC):
         Returns:
             str: Serialized entity
         """
-        return json.dumps(entity.dict() if hasattr(entity, 'dict') else vars(entity))
+        if hasattr(entity, 'model_dump_json'):  # Pydantic model, encoded in one pass
+            return entity.model_dump_json()
+        return json.dumps(vars(entity))
     
     @abstractmethod
     def _deserialize_entity(self, data: str, entity_class: Type[T]) -> T:
@@ -75,8 +78,8 @@ class BaseRedisRepository(BaseRepository[T], ABC):
             T: Deserialized entity
         """
         data_dict = json.loads(data) if isinstance(data, str) else data
-        if hasattr(entity_class, 'parse_obj'):  # Pydantic model
-            return entity_class.parse_obj(data_dict)
+        if hasattr(entity_class, 'model_validate'):  # Pydantic model
+            return entity_class.model_validate(data_dict)
         return entity_class(**data_dict)
     
     async def save(self, entity: T) -> T:
@@ -107,6 +110,21 @@ class BaseRedisRepository(BaseRepository[T], ABC):
         except Exception as e:
             self.logger.error("Error saving entity: %s", str(e), exc_info=True)
             raise
+
+    async def save_many(self, entities: List[T]) -> List[T]:
+        """
+        Save several entities.
+        
+        Each entity goes through save() so TTLs and any index updates
+        done by subclasses are applied.
+        
+        Args:
+            entities: The entities to save
+            
+        Returns:
+            List[T]: The saved entities
+        """
+        return list(await asyncio.gather(*(self.save(entity) for entity in entities)))
     
     async def get_by_id(self, entity_id: Union[UUID, str, int]) -> Optional[T]:
         """
@@ -7,6 +7,7 @@ import logging
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import orjson
 import redis.asyncio as redis_async
 import redis as redis_sync
 from pydantic import BaseModel
@@ -32,14 +33,19 @@ class RedisStorage(StorageProvider):
         self.async_pool = redis_async.ConnectionPool.from_url(
             self.redis_url,
             max_connections=self.max_connections,
-            decode_responses=True  # Auto-decode responses to strings
+            decode_responses=True,  # Auto-decode responses to strings
+            socket_keepalive=True,
+            health_check_interval=30,  # Ping idle connections before reuse
         )
         self.redis_client = redis_async.Redis.from_pool(self.async_pool)
         
         # Sync client for sync operations
         self.sync_client = redis_sync.Redis.from_url(
             self.redis_url,
-            decode_responses=True  # Auto-decode responses to strings
+            max_connections=self.max_connections,
+            decode_responses=True,  # Auto-decode responses to strings
+            socket_keepalive=True,
+            health_check_interval=30,
         )
         
         logger.info(f"Using Redis storage at {self.redis_url}")
@@ -47,22 +53,37 @@ class RedisStorage(StorageProvider):
     async def store(self, key: str, data: Any) -> bool:
         """Store data in Redis"""
         try:
-            if isinstance(data, (dict, list)) or hasattr(data, 'model_dump'):
-                # For Pydantic models, use model_dump()
-                if hasattr(data, 'model_dump'):
-                    data_to_store = json.dumps(data.model_dump(), default=self._json_serializer)
-                else:
-                    # For normal dictionaries or lists
-                    data_to_store = json.dumps(data, default=self._json_serializer)
-            else:
-                data_to_store = str(data)
-            
-            await self.redis_client.set(key, data_to_store)
+            await self.redis_client.set(key, self._encode(data))
             logger.debug(f"Stored data to Redis with key: {key}")
             return True
         except Exception as e:
             logger.error(f"Error storing data for key {key}: {str(e)}")
             return False
+
+    async def store_many(self, items: Dict[str, Any]) -> bool:
+        """Store several keys in a single MSET round trip"""
+        if not items:
+            return True
+        try:
+            await self.redis_client.mset({key: self._encode(data) for key, data in items.items()})
+            logger.debug(f"Stored {len(items)} keys to Redis")
+            return True
+        except Exception as e:
+            logger.error(f"Error storing {len(items)} keys: {str(e)}")
+            return False
+
+    def _encode(self, data: Any) -> str:
+        """Encode a value the way it is written to Redis"""
+        if hasattr(data, 'model_dump'):
+            # For Pydantic models, use model_dump()
+            data = data.model_dump()
+        elif not isinstance(data, (dict, list)):
+            return str(data)
+        # orjson encodes UUIDs, datetimes and enums natively; anything else
+        # falls back to _json_serializer like the stdlib encoder did
+        return orjson.dumps(
+            data, default=self._json_serializer, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
             
     async def set(self, key: str, data: Any) -> bool:
         """Alias for store method (for compatibility with RedisProvider)"""
@@ -84,6 +105,28 @@ class RedisStorage(StorageProvider):
             logger.error(f"Error retrieving data for key {key}: {str(e)}")
             return None
             
+    async def retrieve_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several keys in a single MGET round trip"""
+        if not keys:
+            return []
+        try:
+            values = await self.redis_client.mget(keys)
+        except Exception as e:
+            logger.error(f"Error retrieving {len(keys)} keys: {str(e)}")
+            return [None] * len(keys)
+
+        results = []
+        for data in values:
+            if data is None:
+                results.append(None)
+                continue
+            # Try to parse as JSON, fallback to string
+            try:
+                results.append(json.loads(data))
+            except json.JSONDecodeError:
+                results.append(data)
+        return results
+
     async def get(self, key: str) -> Optional[Any]:
         """Alias for retrieve method (for compatibility with RedisProvider)"""
         return await self.retrieve(key)
@@ -261,17 +304,7 @@ class RedisStorage(StorageProvider):
     def store_sync(self, key: str, data: Any) -> bool:
         """Sync version of store for compatibility"""
         try:
-            if isinstance(data, (dict, list)) or hasattr(data, 'model_dump'):
-                # For Pydantic models, use model_dump()
-                if hasattr(data, 'model_dump'):
-                    data_to_store = json.dumps(data.model_dump(), default=self._json_serializer)
-                else:
-                    # For normal dictionaries or lists
-                    data_to_store = json.dumps(data, default=self._json_serializer)
-            else:
-                data_to_store = str(data)
-            
-            self.sync_client.set(key, data_to_store)
+            self.sync_client.set(key, self._encode(data))
             logger.debug(f"Sync: Stored data to Redis with key: {key}")
             return True
         except Exception as e:
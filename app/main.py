@@ -7,6 +7,7 @@ import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api.middleware.cors import setup_cors
@@ -87,6 +88,8 @@ def create_app() -> FastAPI:
         version=settings.app_version,
         description="AI-powered webtoon creation platform",
         lifespan=lifespan,
+        # orjson encodes UUIDs and datetimes in C; routes returning an explicit response are unaffected
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
     )
@@ -167,4 +170,5 @@ if __name__ == "__main__":
         port=settings.api_port,
         reload=settings.debug,
         log_level=settings.log_level.lower(),
+        loop="auto",  # uvloop when installed (see requirements/base.txt)
     )
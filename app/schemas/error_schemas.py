@@ -28,11 +28,6 @@ class ErrorResponse(BaseModel):
         description="ISO 8601 timestamp of when the error occurred"
     )
     request_id: Optional[str] = Field(None, description="Request correlation ID")
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
 
 
 class NotFoundResponse(ErrorResponse):
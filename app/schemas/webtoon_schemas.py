@@ -12,6 +12,9 @@ from app.application.dto.webtoon_dto import CharacterDTO, PanelDTO, WebtoonDTO
 # Using string literals for art style
 from app.schemas.common_schemas import TimestampMixin
 
+# The from_dto constructors use model_construct: DTOs are built from domain
+# entities that are already valid, so validating every field again is wasted
+
 
 class CharacterAppearanceRequest(BaseModel):
     """Character appearance in requests"""
@@ -50,7 +53,7 @@ class CharacterResponse(BaseModel):
 
     @classmethod
     def from_dto(cls, dto: CharacterDTO) -> "CharacterResponse":
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             name=dto.name,
             description=dto.description,
@@ -91,11 +94,11 @@ class PanelResponse(BaseModel):
     @classmethod
     def from_dto(cls, dto: PanelDTO) -> "PanelResponse":
         dialogue = [
-            DialogueResponse(character=d["character"], text=d["text"])
-            for d in dto.dialogue
+            DialogueResponse.model_construct(character=line.character, text=line.text)
+            for line in dto.dialogue
         ]
 
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             sequence_number=dto.sequence_number,
             scene_description=dto.scene_description,
@@ -131,7 +134,7 @@ class WebtoonResponse(TimestampMixin):
 
     @classmethod
     def from_dto(cls, dto: WebtoonDTO) -> "WebtoonResponse":
-        return cls(
+        return cls.model_construct(
             id=dto.id,
             title=dto.title,
             description=dto.description,
@@ -6,7 +6,7 @@ import logging
 import os
 
 from celery import Celery
-from celery.signals import setup_logging, task_postrun, worker_ready
+from celery.signals import setup_logging, task_postrun, worker_process_init, worker_ready
 
 from app.config import get_settings
 
@@ -41,7 +41,7 @@ celery_app.conf.imports = [
 # Configure Celery
 celery_app.conf.update(
     task_serializer="json",
-    accept_content=["json"],
+    accept_content=("json",),
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
@@ -77,3 +77,19 @@ def config_loggers(*args, **kwargs):
             "root": {"level": "INFO", "handlers": ["console"]},
         }
     )
+
+
+# Run the asyncio work inside tasks on uvloop
+@worker_process_init.connect
+def install_uvloop(*args, **kwargs):
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows; stay on the default loop
+        logger.debug("uvloop not installed, using the default asyncio event loop")
+        return
+
+    # Tasks drive coroutines through asyncio.run()/new_event_loop(), which
+    # create loops from the policy installed here
+    uvloop.install()
+    logger.debug("Installed uvloop event loop policy")
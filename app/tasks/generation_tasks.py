@@ -21,6 +21,8 @@ from app.domain.entities.generation_task import TaskStatus
 from app.domain.repositories.task_repository import TaskRepository
 from app.domain.repositories.webtoon_repository import WebtoonRepository
 from app.application.interfaces.storage_provider import StorageProvider
+from app.application.services.webtoon_service import WebtoonService
+from app.utils.webtoon_renderer import WebtoonRenderer
 
 # Configure root logger to see all debug messages
 logging.basicConfig(level=logging.DEBUG)
@@ -72,6 +74,12 @@ def start_webtoon_generation_task(self, task_id: str):
         if not task:
             logger.error(f"Task {task_id} not found in storage. Cannot proceed with generation.")
             raise ValueError(f"Task {task_id} not found in storage")
+
+        # Settle idempotently: a redelivered message for a finished task must not
+        # pay for the whole generation again or overwrite the recorded outcome
+        if task.is_terminal:
+            logger.info(f"Task {task_id} is already {task.status.value}, skipping generation")
+            return task.result
             
         # Extract the request data from the task
         request_data = task.input_data
@@ -139,7 +147,6 @@ def start_webtoon_generation_task(self, task_id: str):
         # Try to update task status to FAILED
         try:
             from app.infrastructure.storage.file_storage import FileStorage
-            from app.config import get_settings
             settings = get_settings()
             storage_path = getattr(settings, "file_storage_path", getattr(settings, "storage_path", "/app/storage"))
             storage = FileStorage(storage_path)
@@ -203,7 +210,6 @@ async def generate_webtoon_async(
         from app.application.interfaces.image_generator import ImageGenerator
         from app.application.interfaces.notification_publisher import INotificationPublisher
         from app.application.services.generation_service import create_generation_service
-        from app.config import get_settings
         from app.infrastructure.ai.openai_provider import OpenAIProvider
         from app.infrastructure.image.stability_provider import StabilityProvider
 
@@ -244,6 +250,7 @@ async def generate_webtoon_async(
             image_generator=image_generator,
             task_repository=task_repo,
             webtoon_repository=webtoon_repo,
+            max_concurrent_panels=settings.max_concurrent_panel_renders,
         )
 
         # Convert request data to DTO
@@ -257,13 +264,13 @@ async def generate_webtoon_async(
             style_preferences=request_data.get("style_preferences"),
         )
 
-        # Step 2: Generate story
+        # Steps 2-3: Generate story and scenes
         notification_publisher.publish(
             NotificationType.TASK_PROGRESS,
             {
                 "task_id": task_id,
                 "progress": 20.0,
-                "message": "Generating story structure..."
+                "message": "Generating story and panel descriptions..."
             }
         )
 
@@ -271,27 +278,23 @@ async def generate_webtoon_async(
         from app.domain.constants.art_styles import ensure_art_style_string
         art_style_str = ensure_art_style_string(request_dto.art_style)
         
-        # Call AI provider methods directly with await
-        story_data = await ai_provider.generate_story(
+        # One provider request returns both the story and its scenes
+        story_data, scenes_data = await ai_provider.generate_story_and_scenes(
             request_dto.prompt,
             art_style_str,
             request_dto.additional_context,
+            request_dto.num_panels,
         )
 
-        # Step 3: Generate scenes
         notification_publisher.publish(
             NotificationType.TASK_PROGRESS,
             {
                 "task_id": task_id,
                 "progress": 40.0,
-                "message": "Creating panel descriptions..."
+                "message": "Created panel descriptions"
             }
         )
 
-        scenes_data = await ai_provider.generate_scene_descriptions(
-            story_data, request_dto.num_panels
-        )
-
         # Step 4: Generate images
         total_panels = len(scenes_data)
         generated_panels = []
@@ -421,7 +424,8 @@ async def generate_webtoon_async(
                 logger.error(f"Error fetching webtoon with ID {webtoon_id}: {str(e)}")
                 raise Exception(f"Failed to fetch or create webtoon with ID {webtoon_id}: {str(e)}")
             
-            # Create and add panels to the webtoon
+            # Create the panels, then add them to the webtoon in one step
+            panels = []
             for i, panel_data in enumerate(generated_panels):
                 # Create scene object
                 scene = Scene(
@@ -461,8 +465,9 @@ async def generate_webtoon_async(
                 # Add special effects if they exist
                 panel.visual_effects = panel_data.get("special_effects", [])
                 
-                # Add panel to webtoon
-                webtoon.add_panel(panel)
+                panels.append(panel)
+
+            webtoon.extend_panels(panels)
             
             # We already initialized the webtoon_repository above
             # No need to initialize it again
@@ -522,14 +527,9 @@ async def generate_webtoon_async(
         
         # Fetch and broadcast HTML content
         try:
-            # Import the webtoon service and renderer
-            from app.application.services.webtoon_service import WebtoonService
-            from app.utils.webtoon_renderer import WebtoonRenderer
-            
             # We already have webtoon_repo initialized from _get_repositories()
             # Just use that instance for the webtoon service
-            renderer = WebtoonRenderer()
-            webtoon_service = WebtoonService(webtoon_repo, renderer)
+            webtoon_service = WebtoonService(webtoon_repo, WebtoonRenderer())
             
             # Fetch HTML content - directly await the function call
             html_content = await webtoon_service.get_webtoon_html_content(UUID(webtoon_id))
@@ -599,8 +599,8 @@ def start_panel_generation_task(self, task_id: str, request_data: Dict[str, Any]
     # Log environment info to debug API key issues
     logger.info(f"Panel generation task started. Task ID: {task_id}")
     
-    # Access settings via Celery app configuration
-    stability_api_key = celery_app.conf.get('STABILITY_API_KEY') or os.environ.get('STABILITY_API_KEY')
+    # Settings already read STABILITY_API_KEY from the environment once per process
+    stability_api_key = get_settings().stability_api_key
     logger.info(f"STABILITY_API_KEY available: {stability_api_key is not None}")
     if stability_api_key:
         logger.info(f"API key length: {len(stability_api_key)}")
@@ -633,6 +633,11 @@ def start_panel_generation_task(self, task_id: str, request_data: Dict[str, Any]
                 created_at=datetime.now(UTC),
                 progress=TaskProgress()
             )
+        elif task.is_terminal:
+            # Settle idempotently: a redelivered or late message for a finished task
+            # (e.g. marked failed when submission errored) must not render again
+            logger.info(f"Task {task_id} is already {task.status.value}, skipping generation")
+            return task.result
         
         # Update task status to processing
         task.status = TaskStatus.PROCESSING
@@ -685,11 +690,8 @@ def start_panel_generation_task(self, task_id: str, request_data: Dict[str, Any]
                 try:
                     webtoon_id = request_data['webtoon_id']
                     
-                    # Import the webtoon service
-                    from app.application.services.webtoon_service import WebtoonService, get_webtoon_service
-                    
-                    # Get webtoon service
-                    webtoon_service = get_webtoon_service()
+                    # Reuse the repository created for this task
+                    webtoon_service = WebtoonService(webtoon_repo, WebtoonRenderer())
                     
                     # Fetch HTML content asynchronously
                     html_content = asyncio.run(webtoon_service.get_webtoon_html_content(UUID(webtoon_id)))
@@ -749,7 +751,6 @@ def generate_webtoon_sync(task_id: str, request_data: Dict[str, Any]) -> Dict[st
     # Initialize repositories and services
     try:
         # Get settings for storage and other configurations
-        from app.config import get_settings
         settings = get_settings()
         
         # Initialize storage
@@ -892,7 +893,6 @@ def generate_webtoon_sync(task_id: str, request_data: Dict[str, Any]) -> Dict[st
         # Initialize storage and repository if not already done
         if not storage:
             from app.infrastructure.storage.file_storage import FileStorage
-            from app.config import get_settings
             settings = get_settings()
             storage_path = getattr(settings, "file_storage_path", getattr(settings, "storage_path", "/app/storage"))
             storage = FileStorage(storage_path)
@@ -15,7 +15,7 @@ def generate_single_image_task(
     prompt: str, style: str, width: int = 1024, height: int = 1024
 ) -> Dict[str, Any]:
     """Background task for single image generation"""
-    logger.info(f"Generating single image: {prompt[:50]}...")
+    logger.info("Generating single image: %.50s...", prompt)
 
     try:
         # Import here to avoid circular imports
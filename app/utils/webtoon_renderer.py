@@ -42,9 +42,12 @@ class WebtoonRenderer:
         # Sort panels by their position/order if available
         panels = sorted(webtoon.panels, key=lambda p: getattr(p, 'order', 0) if hasattr(p, 'order') else 0)
         
+        # Index character colors once instead of scanning the cast for every bubble
+        character_colors = WebtoonRenderer._character_colors(webtoon.characters)
+
         # Render each panel
         for panel in panels:
-            panel_html = WebtoonRenderer._render_panel(panel, webtoon.characters, webtoon.art_style)
+            panel_html = WebtoonRenderer._render_panel(panel, character_colors, webtoon.art_style)
             html += panel_html
             
         # Close containers
@@ -56,13 +59,37 @@ class WebtoonRenderer:
         return html
     
     @staticmethod
-    def _render_panel(panel: Panel, characters: List[Any], art_style: str) -> str:
+    def _character_colors(characters: List[Any]) -> Dict[str, str]:
+        """
+        Map lower-cased character names to their bubble color
+        
+        Args:
+            characters: List of characters in the webtoon
+            
+        Returns:
+            Dictionary of name to color; the first character with a name wins
+        """
+        colors = {}
+        for character in characters:
+            name = character.name.lower()
+            if name in colors:
+                continue
+            color = "default"
+            # Use character hair color or some other distinctive feature for the bubble styling
+            if hasattr(character, 'appearance') and character.appearance:
+                if hasattr(character.appearance, 'hair_color') and character.appearance.hair_color:
+                    color = character.appearance.hair_color.lower().replace(' ', '-')
+            colors[name] = color
+        return colors
+
+    @staticmethod
+    def _render_panel(panel: Panel, character_colors: Dict[str, str], art_style: str) -> str:
         """
         Renders a single panel as HTML
         
         Args:
             panel: The panel entity to render
-            characters: List of characters for reference
+            character_colors: Bubble colors keyed by lower-cased character name
             art_style: The art style from the webtoon
             
         Returns:
@@ -84,7 +111,7 @@ class WebtoonRenderer:
         if panel.speech_bubbles and len(panel.speech_bubbles) > 0:
             html += """<div class="speech-bubbles-container">"""
             for bubble in panel.speech_bubbles:
-                bubble_html = WebtoonRenderer._render_speech_bubble(bubble, characters)
+                bubble_html = WebtoonRenderer._render_speech_bubble(bubble, character_colors)
                 html += bubble_html
             html += """</div>"""
         
@@ -100,29 +127,20 @@ class WebtoonRenderer:
         return html
     
     @staticmethod
-    def _render_speech_bubble(bubble: SpeechBubble, characters: List[Any]) -> str:
+    def _render_speech_bubble(bubble: SpeechBubble, character_colors: Dict[str, str]) -> str:
         """
         Renders a speech bubble as HTML
         
         Args:
             bubble: The speech bubble entity to render
-            characters: List of characters for reference
+            character_colors: Bubble colors keyed by lower-cased character name
             
         Returns:
             HTML string representation of the speech bubble
         """
-        # Find character by name if available
+        # Find character color by name if available
         character_name = bubble.character_name or "Unknown"
-        character_color = "default"
-        
-        # Try to find matching character for color coding
-        for character in characters:
-            if character.name.lower() == character_name.lower():
-                # Use character hair color or some other distinctive feature for the bubble styling
-                if hasattr(character, 'appearance') and character.appearance:
-                    if hasattr(character.appearance, 'hair_color') and character.appearance.hair_color:
-                        character_color = character.appearance.hair_color.lower().replace(' ', '-')
-                break
+        character_color = character_colors.get(character_name.lower(), "default")
         
         # Determine bubble type CSS class based on style
         bubble_type_class = "speech"
@@ -2,16 +2,37 @@
 """
 WebSocket connection manager
 """
-import json
 import logging
 from datetime import UTC, datetime
-from typing import Dict, Set
+from typing import Any, Dict, Optional, Set
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
 
+def encode_message(message: Dict[str, Any]) -> str:
+    """Serialize a WebSocket message to JSON text
+
+    Broadcasts encode once with this and send the result to every recipient.
+    """
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def try_encode_message(message: Dict[str, Any], recipient: str) -> Optional[str]:
+    """Serialize a WebSocket message, or log and return None if it cannot be
+
+    A message that cannot be serialized is not the connection's fault, so
+    callers skip the send rather than raise or drop the connection.
+    """
+    try:
+        return encode_message(message)
+    except TypeError as e:
+        logger.error(f"Error encoding message for {recipient}: {str(e)}")
+        return None
+
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates"""
 
@@ -77,12 +98,20 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, client_id: str):
         """Send a message to a specific client"""
         if client_id in self.active_connections:
-            try:
-                websocket = self.active_connections[client_id]
-                await websocket.send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Error sending message to {client_id}: {str(e)}")
-                await self.disconnect(client_id)
+            payload = try_encode_message(message, client_id)
+            if payload is not None:
+                await self.send_raw(payload, client_id)
+
+    async def send_raw(self, payload: str, client_id: str):
+        """Send an already serialized message to a specific client"""
+        websocket = self.active_connections.get(client_id)
+        if websocket is None:
+            return
+        try:
+            await websocket.send_text(payload)
+        except Exception as e:
+            logger.error(f"Error sending message to {client_id}: {str(e)}")
+            await self.disconnect(client_id)
 
     async def subscribe_to_task(self, client_id: str, task_id: str):
         """Subscribe a client to task updates"""
@@ -130,10 +159,13 @@ class ConnectionManager:
             return
 
         message = {"type": "task_update", "task_id": task_id, **update}
+        payload = try_encode_message(message, f"task {task_id}")
+        if payload is None:
+            return
 
         # Send to all subscribed clients
         for client_id in self.task_subscriptions[task_id].copy():
-            await self.send_personal_message(message, client_id)
+            await self.send_raw(payload, client_id)
 
     async def broadcast_generation_progress(
         self,
@@ -201,10 +233,15 @@ class ConnectionManager:
             "timestamp": datetime.now(UTC).isoformat(),
         }
         
+        # Encode once: the HTML content can be large and is the same for everyone
+        payload = try_encode_message(update, f"webtoon {webtoon_id}")
+        if payload is None:
+            return
+
         # Send update to all target clients
         for client_id in target_clients:
             logger.info(f"Sending webtoon update to client {client_id}")
-            await self.send_personal_message(update, client_id)
+            await self.send_raw(payload, client_id)
             
         logger.info(
             f"Broadcast webtoon update for {webtoon_id} to {len(target_clients)} clients"
@@ -172,7 +172,7 @@ class BaseWebSocketHandler(abc.ABC):
         if isinstance(message, WebSocketEvent):
             message_dict = message.to_dict()
         elif isinstance(message, BaseModel):
-            message_dict = message.dict()
+            message_dict = message.model_dump()
         elif isinstance(message, dict):
             message_dict = message.copy()
             if message_type:
@@ -201,7 +201,7 @@ class BaseWebSocketHandler(abc.ABC):
         if isinstance(message, WebSocketEvent):
             message_dict = message.to_dict()
         elif isinstance(message, BaseModel):
-            message_dict = message.dict()
+            message_dict = message.model_dump()
         elif isinstance(message, dict):
             message_dict = message.copy()
             if message_type:
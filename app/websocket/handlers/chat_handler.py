@@ -86,7 +86,7 @@ class ChatHandler(BaseWebSocketHandler):
             await self.room_manager.join_room(client_id, room_id, websocket)
             
             # Get updated room info
-            room_info = await self.room_manager.get_room_info(room_id)
+            room_info = await self.room_manager.get_room_info(room_id, include_participants=False)
             
             # Notify client of successful join
             join_message = {
@@ -174,7 +174,7 @@ class ChatHandler(BaseWebSocketHandler):
         if left_room_id:
             # Get updated room info
             try:
-                room_info = await self.room_manager.get_room_info(left_room_id)
+                room_info = await self.room_manager.get_room_info(left_room_id, include_participants=False)
                 participant_count = room_info["participant_count"]
             except WebSocketValidationError:
                 # Room no longer exists (last participant)
@@ -275,7 +275,7 @@ class ChatHandler(BaseWebSocketHandler):
         )
 
         logger.debug(
-            f"Chat message from {client_id} in room {room_id}: {chat_text[:50]}"
+            "Chat message from %s in room %s: %.50s", client_id, room_id, chat_text
         )
         
         # If chat service available, persist message
@@ -439,7 +439,7 @@ class ChatHandler(BaseWebSocketHandler):
         if left_room_id:
             # Get updated room info
             try:
-                room_info = await self.room_manager.get_room_info(left_room_id)
+                room_info = await self.room_manager.get_room_info(left_room_id, include_participants=False)
                 participant_count = room_info["participant_count"]
             except WebSocketValidationError:
                 # Room no longer exists (last participant)
@@ -482,7 +482,7 @@ class ChatHandler(BaseWebSocketHandler):
         if left_room_id:
             # Get updated room info
             try:
-                room_info = await self.room_manager.get_room_info(room_id)
+                room_info = await self.room_manager.get_room_info(room_id, include_participants=False)
                 participant_count = room_info["participant_count"]
             except WebSocketValidationError:
                 # Room no longer exists (last participant)
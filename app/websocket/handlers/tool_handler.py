@@ -189,7 +189,7 @@ class ToolHandler(BaseWebSocketHandler):
                 tool_id=tool_id,
                 call_id=call_id,
                 result=result
-            ).dict()
+            ).model_dump()
             
         except Exception as e:
             logger.error(f"Error executing tool {tool_id} for client {client_id}: {str(e)}", exc_info=True)
@@ -199,7 +199,7 @@ class ToolHandler(BaseWebSocketHandler):
                 tool_id=tool_id,
                 call_id=call_id,
                 error=str(e)
-            ).dict()
+            ).model_dump()
         
         await self.send_message(client_id, response)
     
@@ -153,12 +153,14 @@ class RoomManager:
         """
         return room_id in self.rooms
     
-    async def get_room_info(self, room_id: str) -> Dict:
+    async def get_room_info(self, room_id: str, include_participants: bool = True) -> Dict:
         """
         Get information about a room.
         
         Args:
             room_id: The ID of the room
+            include_participants: Whether to list the participant IDs; callers
+                that only need the count can skip copying them
             
         Returns:
             Dictionary containing room information
@@ -170,11 +172,13 @@ class RoomManager:
             raise WebSocketValidationError(f"Room {room_id} does not exist")
             
         clients = await self.get_room_clients(room_id)
-        return {
+        info = {
             "room_id": room_id,
             "participant_count": len(clients),
-            "participants": list(clients)
         }
+        if include_participants:
+            info["participants"] = list(clients)
+        return info
     
     async def broadcast_to_room(
         self,
@@ -67,6 +67,20 @@ class TestBaseService:
         # Then
         mock_error_handler.handle_error.assert_awaited_once_with(error, context)
     
+    def test_handle_error_outside_event_loop(self, mock_error_handler, caplog):
+        """Test handle_error falls back to logging when no event loop is running."""
+        # Given
+        service = BaseService(error_handler=mock_error_handler)
+        error = ValueError("Test error")
+        
+        # When
+        with caplog.at_level(logging.ERROR):
+            service.handle_error(error)
+        
+        # Then
+        mock_error_handler.handle_error.assert_not_called()
+        assert "Unhandled error: Test error" in caplog.text
+    
     def test_handle_error_without_handler(self, caplog):
         """Test handle_error when no error handler is configured."""
         # Given
@@ -0,0 +1,75 @@
+"""
+Tests for the generic batcher.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.services.batcher import Batcher
+
+
+class TestBatcher:
+    """Tests for Batcher batching."""
+
+    @pytest.mark.asyncio
+    async def test_each_caller_gets_its_own_result(self):
+        """Results are matched to callers by position in the batch."""
+        # Given
+        flush = AsyncMock(side_effect=lambda items: [item * 2 for item in items])
+        batcher = Batcher(flush, flush_interval=0.01)
+
+        # When
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+        # Then
+        assert results == [0, 2, 4]
+        flush.assert_awaited_once_with([0, 1, 2])
+
+    @pytest.mark.asyncio
+    async def test_lone_item_does_not_wait_for_the_interval(self):
+        """An uncontended call is flushed without the batching delay."""
+        # Given
+        flush = AsyncMock(side_effect=lambda items: items)
+        batcher = Batcher(flush, flush_interval=60)
+
+        # When
+        result = await asyncio.wait_for(batcher.submit("only"), timeout=1)
+
+        # Then
+        assert result == "only"
+
+    @pytest.mark.asyncio
+    async def test_short_result_fails_every_caller(self):
+        """A flush that returns too few results fails the batch instead of hanging."""
+        # Given
+        flush = AsyncMock(return_value=["one"])
+        batcher = Batcher(flush, flush_interval=0.01)
+
+        # When
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(batcher.submit(i) for i in range(2)), return_exceptions=True
+            ),
+            timeout=1,
+        )
+
+        # Then
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_stopped_flusher_fails_waiting_callers_and_restarts(self):
+        """Callers are failed, not left waiting, when the flusher stops."""
+        # Given
+        flush = AsyncMock(side_effect=[asyncio.CancelledError(), ["ok"]])
+        batcher = Batcher(flush, flush_interval=0.01)
+
+        # When
+        first = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("lost"), return_exceptions=True), timeout=1
+        )
+        second = await asyncio.wait_for(batcher.submit("kept"), timeout=1)
+
+        # Then
+        assert isinstance(first[0], RuntimeError)
+        assert second == "ok"
@@ -0,0 +1,288 @@
+"""
+Tests for the generation service.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from kombu.serialization import dumps, loads
+
+from app.application.dto.generation_dto import GenerationRequestDTO
+from app.application.services.generation_service import GenerationService, _style_prompt_text
+from app.domain.entities.panel import Panel
+from app.domain.entities.webtoon import Webtoon
+from app.domain.value_objects.dimensions import PanelDimensions, PanelSize
+from app.domain.value_objects.position import Position
+from app.domain.value_objects.style import StyleConfiguration
+from app.tasks.celery_app import celery_app
+
+
+class TestCreateCharacterFromData:
+    """Tests for building characters from AI-generated payloads."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a generation service with mocked collaborators."""
+        return GenerationService(AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock())
+
+    def test_builds_character_with_traits_and_appearance(self, service):
+        """Payload fields map onto the character entity."""
+        # Given
+        char_data = {
+            "name": "Mira",
+            "appearance": "tall mage",
+            "hair_color": "silver",
+            "personality": ["curious", "stubborn"],
+        }
+
+        # When
+        character = service._create_character_from_data(char_data)
+
+        # Then
+        assert character.name == "Mira"
+        assert character.appearance.hair_color == "silver"
+        assert character.personality_traits == ["curious", "stubborn"]
+
+    def test_repeated_payloads_yield_independent_characters(self, service):
+        """Identical payloads still yield separate entities."""
+        # Given
+        char_data = {"name": "Mira", "personality": {"temper": "calm"}}
+
+        # When
+        first = service._create_character_from_data(char_data)
+        second = service._create_character_from_data(char_data)
+        first.personality_traits.append("brave")
+
+        # Then
+        assert first.id != second.id
+        assert second.personality_traits == ["temper: calm"]
+
+    def test_missing_name_raises(self, service):
+        """A payload without a name is rejected."""
+        with pytest.raises(ValueError):
+            service._create_character_from_data({"name": ""})
+
+
+class TestBuildPanelSkeleton:
+    """Tests for building panels from AI-generated scene data."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a generation service with mocked collaborators."""
+        return GenerationService(AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock())
+
+    def test_invalid_dialogue_entries_are_skipped(self, service):
+        """A bubble that fails validation does not drop the rest of the dialogue."""
+        # Given
+        scene_data = {
+            "visual_description": "A rooftop at dusk",
+            "dialogue": [{"character": "Mira", "text": ""}, "Look out!"],
+        }
+
+        # When
+        panel = service._build_panel_skeleton(scene_data, "webtoon")
+
+        # Then
+        assert [bubble.text for bubble in panel.speech_bubbles] == ["Look out!"]
+
+    def test_bubbles_alternate_shared_positions(self, service):
+        """Speech bubbles alternate sides and reuse the same position objects."""
+        # Given
+        scene_data = {"dialogue": ["One", "Two", "Three"]}
+
+        # When
+        panel = service._build_panel_skeleton(scene_data, "webtoon")
+
+        # Then
+        first, second, third = (bubble.position for bubble in panel.speech_bubbles)
+        assert first == Position.from_named_position("top-left")
+        assert second == Position.from_named_position("top-right")
+        assert third is first
+
+    def test_unknown_panel_size_raises(self, service):
+        """Scene data with an unsupported panel size is rejected."""
+        with pytest.raises(ValueError):
+            service._build_panel_skeleton({"panel_size": "poster"}, "webtoon")
+
+    def test_panels_of_one_size_share_dimensions(self, service):
+        """Panel dimensions are looked up once per size and shared."""
+        # When
+        first = service._build_panel_skeleton({"panel_size": "half"}, "webtoon")
+        second = service._build_panel_skeleton({"panel_size": "half"}, "webtoon")
+
+        # Then
+        assert first.dimensions == PanelDimensions.from_size(PanelSize.HALF)
+        assert first.dimensions is second.dimensions
+
+    def test_building_without_images_skips_bad_scenes(self, service):
+        """Panels built in one pass keep the valid scenes in order."""
+        # Given
+        scenes = [
+            {"visual_description": "One"},
+            {"panel_size": "poster"},
+            {"visual_description": "Two"},
+        ]
+
+        # When
+        panels = service._build_panel_skeletons(scenes, "webtoon", {})
+
+        # Then
+        assert [panel.scene.description for panel in panels] == ["One", "Two"]
+
+
+class TestStylePromptText:
+    """Tests for the cached style prompt text."""
+
+    def test_matches_style_configuration(self):
+        """The cached text is the style configuration's prompt text."""
+        assert _style_prompt_text("manga") == StyleConfiguration.for_style("manga").to_prompt_text()
+
+
+class TestStartPanelGeneration:
+    """Tests for submitting panel generation to Celery."""
+
+    @pytest.mark.asyncio
+    async def test_task_args_survive_the_configured_serializer(self):
+        """The submitted args round-trip through the Celery task serializer."""
+        # Given
+        service = GenerationService(
+            AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock(), task_buffer=AsyncMock()
+        )
+
+        # When
+        with patch("app.tasks.generation_tasks.start_panel_generation_task.delay") as delay:
+            result = await service.start_panel_generation(
+                scene_description="A lone astronaut on Mars",
+                art_style="webtoon",
+                character_names=["astronaut"],
+                style_preferences={"lighting": "dramatic"},
+            )
+
+        # Then
+        kwargs = delay.call_args.kwargs
+        content_type, encoding, body = dumps(kwargs, serializer=celery_app.conf.task_serializer)
+        assert loads(body, content_type, encoding) == kwargs
+        assert kwargs["task_id"] == str(result.task_id)
+
+
+class TestGenerateWebtoonSync:
+    """Tests for the synchronous webtoon generation pipeline."""
+
+    @staticmethod
+    def _service(ai_provider, image_generator, max_concurrent_panels=4):
+        """Create a service whose repository returns the webtoon it saves."""
+        webtoon_repository = AsyncMock()
+        webtoon_repository.save = AsyncMock(side_effect=lambda webtoon: webtoon)
+        return GenerationService(
+            ai_provider,
+            image_generator,
+            webtoon_repository,
+            AsyncMock(),
+            max_concurrent_panels=max_concurrent_panels,
+        )
+
+    @staticmethod
+    def _story(num_panels):
+        """Story and scene payloads as returned by the AI provider."""
+        story = {"title": "Skyline", "main_characters": [{"name": "Mira"}]}
+        scenes = [{"visual_description": f"Scene {i}"} for i in range(num_panels)]
+        return story, scenes
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_share_one_generation(self):
+        """Requests that arrive while an identical one runs join it."""
+        # Given
+        release = asyncio.Event()
+
+        async def generate_story_and_scenes(*args):
+            await release.wait()
+            return self._story(2)
+
+        ai_provider = AsyncMock()
+        ai_provider.generate_story_and_scenes = AsyncMock(side_effect=generate_story_and_scenes)
+        image_generator = MagicMock()
+        image_generator.is_available.return_value = False
+        request = GenerationRequestDTO(prompt="A rooftop chase", num_panels=2)
+
+        # When
+        first = asyncio.ensure_future(
+            self._service(ai_provider, image_generator).generate_webtoon_sync(request)
+        )
+        second = asyncio.ensure_future(
+            self._service(ai_provider, image_generator).generate_webtoon_sync(request)
+        )
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second)
+
+        # Then
+        ai_provider.generate_story_and_scenes.assert_awaited_once()
+        assert results[0] == results[1]
+        assert results[0]["panel_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_panel_renders_are_capped_and_attached_in_order(self):
+        """At most max_concurrent_panels images render at once and every panel is kept."""
+        # Given
+        rendering = 0
+        peak = 0
+
+        async def generate_image(prompt, width, height, style):
+            nonlocal rendering, peak
+            rendering += 1
+            peak = max(peak, rendering)
+            await asyncio.sleep(0.01)
+            rendering -= 1
+            return "/tmp/panel.png", "https://cdn.example/panel.png"
+
+        ai_provider = AsyncMock()
+        ai_provider.generate_story_and_scenes = AsyncMock(return_value=self._story(5))
+        ai_provider.enhance_visual_description = AsyncMock(return_value="prompt")
+        image_generator = MagicMock()
+        image_generator.is_available.return_value = True
+        image_generator.generate_image = AsyncMock(side_effect=generate_image)
+        service = self._service(ai_provider, image_generator, max_concurrent_panels=2)
+
+        # When
+        result = await service.generate_webtoon_sync(
+            GenerationRequestDTO(prompt="A rooftop chase", num_panels=5)
+        )
+
+        # Then
+        webtoon = service.webtoon_repository.save.await_args.args[0]
+        assert peak == 2
+        assert result["panel_count"] == 5
+        assert [panel.sequence_number for panel in webtoon.panels] == list(range(5))
+        assert [panel.scene.description for panel in webtoon.panels] == [
+            f"Scene {i}" for i in range(5)
+        ]
+        assert all(panel.image_url for panel in webtoon.panels)
+
+
+class TestWebtoonGenerationHelpers:
+    """Tests for the Webtoon helpers used by the generation pipeline."""
+
+    def test_extend_panels_continues_the_sequence(self):
+        """Panels added in bulk are numbered after the existing ones."""
+        # Given
+        webtoon = Webtoon(title="Skyline")
+        webtoon.add_panel(Panel())
+        panels = [Panel(), Panel()]
+
+        # When
+        webtoon.extend_panels(panels)
+
+        # Then
+        assert [panel.sequence_number for panel in webtoon.panels] == [0, 1, 2]
+        assert webtoon.panels[1:] == panels
+
+    def test_create_pending_mints_an_id_and_placeholder_title(self):
+        """The placeholder carries the art style and a title derived from the prompt."""
+        # When
+        first = Webtoon.create_pending("A rooftop chase across the city at dusk", "manga")
+        second = Webtoon.create_pending("A rooftop chase across the city at dusk", "manga")
+
+        # Then
+        assert first.id != second.id
+        assert first.title == "Generating: A rooftop chase across the cit..."
+        assert first.art_style == "manga"
@@ -1,5 +1,8 @@
 """Unit tests for the RoomService class."""
 import asyncio
+import json
+from datetime import datetime, timedelta
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -13,6 +16,7 @@ from app.websocket.exceptions import WebSocketError
 def mock_connection_manager():
     """Fixture providing a mock connection manager."""
     manager = MagicMock(spec=ConnectionManager)
+    manager.active_connections = {}
     manager.send_personal_message = AsyncMock()
     manager.broadcast = AsyncMock()
     return manager
@@ -203,6 +207,117 @@ async def test_broadcast_exclude_client(room_service, mock_connection_manager):
     assert args[1] == client2  # client_id is the second argument
 
 
+@pytest.mark.asyncio
+async def test_broadcast_continues_after_failed_send(room_service, mock_connection_manager):
+    """Test that one failing client does not stop delivery to the others."""
+    room_id = await room_service.create_room()
+    await room_service.join_room("client-1", room_id)
+    await room_service.join_room("client-2", room_id)
+    mock_connection_manager.send_personal_message.reset_mock()
+
+    async def send(message, client_id):
+        if client_id == "client-1":
+            raise ConnectionError("socket closed")
+
+    mock_connection_manager.send_personal_message.side_effect = send
+
+    await room_service.broadcast_to_room(room_id, {"type": "test_message"})
+
+    sent_to = {call.args[1] for call in mock_connection_manager.send_personal_message.call_args_list}
+    assert sent_to == {"client-1", "client-2"}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_uses_socket_from_join(room_service, mock_connection_manager):
+    """Test that clients who joined with a socket are sent to directly."""
+    room_id = await room_service.create_room()
+    websocket = AsyncMock()
+    mock_connection_manager.active_connections["client-1"] = websocket
+    await room_service.join_room("client-1", room_id, websocket)
+    mock_connection_manager.send_personal_message.reset_mock()
+
+    await room_service.broadcast_to_room(room_id, {"type": "test_message"})
+
+    websocket.send_text.assert_awaited_once_with('{"type":"test_message"}')
+    mock_connection_manager.send_personal_message.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_after_reconnect_uses_live_socket(room_service, mock_connection_manager):
+    """Test that a client who reconnected is sent to on its current connection."""
+    room_id = await room_service.create_room()
+    stale = AsyncMock()
+    await room_service.join_room("client-1", room_id, stale)
+    live = AsyncMock()
+    mock_connection_manager.active_connections["client-1"] = live
+
+    await room_service.broadcast_to_room(room_id, {"type": "test_message"})
+
+    live.send_text.assert_awaited_once_with('{"type":"test_message"}')
+    stale.send_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_skips_client_dropped_by_manager(room_service, mock_connection_manager):
+    """Test that a client the manager no longer holds is not sent to."""
+    room_id = await room_service.create_room()
+    websocket = AsyncMock()
+    await room_service.join_room("client-1", room_id, websocket)
+
+    await room_service.broadcast_to_room(room_id, {"type": "test_message"})
+
+    websocket.send_text.assert_not_called()
+    mock_connection_manager.disconnect.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_failed_send_on_stale_socket_keeps_live_connection(room_service, mock_connection_manager):
+    """Test that a broken socket replaced by a reconnect does not disconnect the client."""
+    room_id = await room_service.create_room()
+    stale = AsyncMock()
+    mock_connection_manager.active_connections["client-1"] = stale
+    await room_service.join_room("client-1", room_id, stale)
+
+    async def reconnect_then_fail(payload):
+        # The client reconnects while the send to the old socket is in flight
+        mock_connection_manager.active_connections["client-1"] = AsyncMock()
+        raise RuntimeError("socket closed")
+
+    stale.send_text.side_effect = reconnect_then_fail
+
+    await room_service.broadcast_to_room(room_id, {"type": "test_message"})
+
+    mock_connection_manager.disconnect.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unserializable_broadcast_is_logged_not_raised(room_service, mock_connection_manager):
+    """Test that a room message that cannot be encoded is skipped without raising."""
+    room_id = await room_service.create_room()
+    websocket = AsyncMock()
+    mock_connection_manager.active_connections["client-1"] = websocket
+    await room_service.join_room("client-1", room_id, websocket)
+
+    await room_service.broadcast_to_room(room_id, {"type": "test_message", "data": object()})
+
+    websocket.send_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_room_update_timestamp_is_iso_formatted(room_service, mock_connection_manager):
+    """Test that room notifications carry an ISO 8601 UTC timestamp on the wire."""
+    room_id = await room_service.create_room()
+    websocket = AsyncMock()
+    mock_connection_manager.active_connections["client-1"] = websocket
+    await room_service.join_room("client-1", room_id, websocket)
+
+    await room_service.join_room("client-2", room_id)
+
+    payload = json.loads(websocket.send_text.await_args.args[0])
+    assert payload["event"] == "participant_joined"
+    assert datetime.fromisoformat(payload["timestamp"]).utcoffset() == timedelta(0)
+
+
 @pytest.mark.asyncio
 async def test_get_room_info(room_service):
     """Test getting room information."""
@@ -220,6 +335,18 @@ async def test_get_room_info(room_service):
     assert info["metadata"] == metadata
 
 
+@pytest.mark.asyncio
+async def test_get_room_info_without_participants(room_service):
+    """Test that the participant list can be skipped when only the count is needed."""
+    room_id = await room_service.create_room()
+    await room_service.join_room("client-1", room_id)
+
+    info = await room_service.get_room_info(room_id, include_participants=False)
+
+    assert info["participant_count"] == 1
+    assert "participants" not in info
+
+
 @pytest.mark.asyncio
 async def test_get_nonexistent_room_info(room_service):
     """Test getting info for a non-existent room."""
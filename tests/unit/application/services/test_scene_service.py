@@ -0,0 +1,78 @@
+"""
+Tests for the scene service.
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.services.scene_service import SceneService
+from app.domain.entities.character import Character
+from app.domain.entities.scene import Scene
+
+
+class TestBuildCharacterContext:
+    """Tests for building character context for scene enhancement."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a scene service with a mocked AI provider."""
+        return SceneService(AsyncMock())
+
+    def test_known_and_unknown_characters(self, service):
+        """Known names get full descriptions, unknown names a placeholder."""
+        # Given
+        mira = Character(name="Mira", description="A curious mage")
+
+        # When
+        context = service._build_character_context([mira], ["Mira", "Kai"])
+
+        # Then
+        assert context == {
+            "Mira": mira.get_full_description(),
+            "Kai": "Character named Kai",
+        }
+
+    def test_first_character_with_a_name_wins(self, service):
+        """Duplicate names resolve to the first matching character."""
+        # Given
+        first = Character(name="Mira", description="First")
+        second = Character(name="Mira", description="Second")
+
+        # When
+        context = service._build_character_context([first, second], ["Mira"])
+
+        # Then
+        assert context["Mira"] == first.get_full_description()
+
+
+class TestValidateSceneComposition:
+    """Tests for scene composition checks."""
+
+    @pytest.fixture
+    def service(self):
+        """Create a scene service with a mocked AI provider."""
+        return SceneService(AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_mismatched_lighting_is_reported(self, service):
+        """Lighting outside the mood's recommendations is flagged."""
+        # Given
+        scene = Scene(description="A funeral", mood="sad", lighting="bright", character_names=["Mira"])
+
+        # When
+        issues = await service.validate_scene_composition(scene)
+
+        # Then
+        assert issues == ["Lighting 'bright' may not match mood 'sad'"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_mood_accepts_any_lighting(self, service):
+        """Moods without recommendations are not checked."""
+        # Given
+        scene = Scene(description="A market", mood="busy", lighting="harsh", character_names=["Mira"])
+
+        # When
+        issues = await service.validate_scene_composition(scene)
+
+        # Then
+        assert issues == []
@@ -0,0 +1,65 @@
+"""
+Tests for the task write buffer.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.services.task_write_buffer import TaskWriteBuffer
+from app.domain.entities.generation_task import GenerationTask, TaskType
+
+
+class TestTaskWriteBuffer:
+    """Tests for TaskWriteBuffer batching."""
+
+    @pytest.fixture
+    def repository(self):
+        """Create a repository mock that records save_many batches."""
+        repository = AsyncMock()
+        repository.save_many = AsyncMock(side_effect=lambda tasks: tasks)
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_concurrent_enqueues_share_one_write(self, repository):
+        """Tasks queued together are written with a single save_many call."""
+        # Given
+        buffer = TaskWriteBuffer(repository, flush_interval=0.01)
+        tasks = [GenerationTask(task_type=TaskType.PANEL_GENERATION) for _ in range(5)]
+
+        # When
+        saved = await asyncio.gather(*(buffer.enqueue(task) for task in tasks))
+
+        # Then
+        assert saved == tasks
+        repository.save_many.assert_awaited_once_with(tasks)
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_batch_size(self, repository):
+        """A full batch is flushed without waiting for the interval."""
+        # Given
+        buffer = TaskWriteBuffer(repository, max_batch_size=2, flush_interval=0.01)
+        tasks = [GenerationTask(task_type=TaskType.PANEL_GENERATION) for _ in range(3)]
+
+        # When
+        await asyncio.gather(*(buffer.enqueue(task) for task in tasks))
+
+        # Then
+        batches = [call.args[0] for call in repository.save_many.await_args_list]
+        assert batches == [tasks[:2], tasks[2:]]
+
+    @pytest.mark.asyncio
+    async def test_write_errors_reach_every_caller(self, repository):
+        """A failed flush is raised to each caller waiting on that batch."""
+        # Given
+        repository.save_many.side_effect = RuntimeError("storage down")
+        buffer = TaskWriteBuffer(repository, flush_interval=0.01)
+        tasks = [GenerationTask(task_type=TaskType.PANEL_GENERATION) for _ in range(2)]
+
+        # When
+        results = await asyncio.gather(
+            *(buffer.enqueue(task) for task in tasks), return_exceptions=True
+        )
+
+        # Then
+        assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,84 @@
+"""
+Tests for the webtoon loader.
+"""
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.services.webtoon_loader import WebtoonLoader
+from app.domain.entities.webtoon import Webtoon
+
+
+class TestWebtoonLoader:
+    """Tests for WebtoonLoader batching."""
+
+    @pytest.fixture
+    def webtoons(self):
+        """Create a few stored webtoons."""
+        return [Webtoon(title=f"Webtoon {i}") for i in range(3)]
+
+    @pytest.fixture
+    def repository(self, webtoons):
+        """Create a repository mock that records get_by_ids batches."""
+        by_id = {webtoon.id: webtoon for webtoon in webtoons}
+        repository = AsyncMock()
+        repository.get_by_ids = AsyncMock(
+            side_effect=lambda ids: {i: by_id[i] for i in ids if i in by_id}
+        )
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_read(self, repository, webtoons):
+        """Lookups queued together are read with a single get_by_ids call."""
+        # Given
+        loader = WebtoonLoader(repository, flush_interval=0.01)
+        ids = [webtoon.id for webtoon in webtoons]
+
+        # When
+        loaded = await asyncio.gather(*(loader.load(webtoon_id) for webtoon_id in ids))
+
+        # Then
+        assert loaded == webtoons
+        repository.get_by_ids.assert_awaited_once_with(ids)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_are_read_once(self, repository, webtoons):
+        """Concurrent lookups of the same webtoon share one entity."""
+        # Given
+        loader = WebtoonLoader(repository, flush_interval=0.01)
+        webtoon_id = webtoons[0].id
+
+        # When
+        first, second = await asyncio.gather(loader.load(webtoon_id), loader.load(webtoon_id))
+
+        # Then
+        assert first is second
+        repository.get_by_ids.assert_awaited_once_with([webtoon_id])
+
+    @pytest.mark.asyncio
+    async def test_missing_webtoon_loads_as_none(self, repository):
+        """An unknown ID resolves to None."""
+        # Given
+        loader = WebtoonLoader(repository, flush_interval=0.01)
+
+        # When
+        loaded = await loader.load(Webtoon(title="Unsaved").id)
+
+        # Then
+        assert loaded is None
+
+    @pytest.mark.asyncio
+    async def test_read_errors_reach_every_caller(self, repository, webtoons):
+        """A failed read is raised to each caller waiting on that batch."""
+        # Given
+        repository.get_by_ids.side_effect = RuntimeError("storage down")
+        loader = WebtoonLoader(repository, flush_interval=0.01)
+
+        # When
+        results = await asyncio.gather(
+            *(loader.load(webtoon.id) for webtoon in webtoons), return_exceptions=True
+        )
+
+        # Then
+        assert all(isinstance(result, RuntimeError) for result in results)
@@ -0,0 +1,220 @@
+"""
+Tests for the webtoon service.
+"""
+import dataclasses
+import functools
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.application.dto.webtoon_dto import DialogueDTO
+from app.application.services.webtoon_service import WebtoonDTOMapper, WebtoonService
+from app.domain.entities.character import Character
+from app.domain.entities.panel import Panel, SpeechBubble
+from app.domain.entities.scene import Scene
+from app.domain.entities.webtoon import Webtoon
+from app.domain.repositories.base_repository import BaseRepository
+from app.domain.value_objects.dimensions import PanelSize
+from app.schemas.webtoon_schemas import WebtoonResponse
+from app.utils.webtoon_renderer import WebtoonRenderer
+
+
+class TestWebtoonDTOMapper:
+    """Tests for converting webtoon entities to DTOs."""
+
+    @pytest.fixture
+    def webtoon(self):
+        """Create a webtoon with one character and one panel."""
+        webtoon = Webtoon(title="Skyline", description="A rooftop chase")
+        webtoon.add_character(Character(name="Mira", personality_traits=["curious"]))
+        panel = Panel(
+            scene=Scene(description="Rooftop at dusk", character_names=["Mira"]),
+            visual_effects=["glow"],
+        )
+        panel.add_speech_bubble(SpeechBubble(character_name="Mira", text="Look out!"))
+        webtoon.add_panel(panel)
+        return webtoon
+
+    def test_to_dto_maps_panels_and_characters(self, webtoon):
+        """The DTO carries the webtoon's panels, dialogue and characters."""
+        # When
+        dto = WebtoonDTOMapper.to_dto(webtoon)
+
+        # Then
+        assert dto.panel_count == 1
+        assert isinstance(dto.panels, tuple)
+        assert dto.panels[0].dialogue == (DialogueDTO("Mira", "Look out!"),)
+        assert dto.panels[0].character_names == ["Mira"]
+        assert dto.characters[0].personality_traits == ["curious"]
+        assert WebtoonResponse.from_dto(dto).title == "Skyline"
+
+    def test_response_from_dto_matches_validated_response(self, webtoon):
+        """Responses built without validation dump the same as validated ones."""
+        # Given
+        response = WebtoonResponse.from_dto(WebtoonDTOMapper.to_dto(webtoon))
+
+        # When
+        validated = WebtoonResponse.model_validate(response.model_dump())
+
+        # Then
+        assert response.model_dump() == validated.model_dump()
+        assert response.panels[0].dialogue[0].character == "Mira"
+
+    def test_dto_is_a_snapshot(self, webtoon):
+        """DTOs are immutable and do not share lists with the entity."""
+        # Given
+        dto = WebtoonDTOMapper.to_dto(webtoon)
+
+        # When
+        webtoon.characters[0].personality_traits.append("brave")
+        webtoon.panels[0].visual_effects.append("rain")
+
+        # Then
+        assert dto.characters[0].personality_traits == ["curious"]
+        assert dto.panels[0].visual_effects == ["glow"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            dto.title = "Renamed"
+
+
+class TestListWebtoons:
+    """Tests for listing webtoons as DTOs."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count", [2, 300])
+    async def test_get_all_maps_every_webtoon(self, count):
+        """Small and large listings map every webtoon in order."""
+        # Given
+        webtoons = [Webtoon(title=f"Webtoon {i}") for i in range(count)]
+        repository = AsyncMock()
+        repository.get_all = AsyncMock(return_value=webtoons)
+        service = WebtoonService(repository, WebtoonRenderer())
+
+        # When
+        dtos = await service.get_all_webtoons()
+
+        # Then
+        assert [dto.id for dto in dtos] == [webtoon.id for webtoon in webtoons]
+
+
+class TestPublishWebtoon:
+    """Tests for publishing a webtoon."""
+
+    @pytest.mark.asyncio
+    async def test_publish_saves_and_returns_the_loaded_webtoon(self):
+        """The webtoon is loaded, published and saved through one repository call."""
+        # Given
+        webtoon = Webtoon(title="Skyline")
+        repository = AsyncMock()
+        repository.get_by_id = AsyncMock(return_value=webtoon)
+        repository.save = AsyncMock(side_effect=lambda entity: entity)
+        repository.mutate = functools.partial(BaseRepository.mutate, repository)
+        service = WebtoonService(repository, WebtoonRenderer())
+
+        # When
+        dto = await service.publish_webtoon(webtoon.id)
+
+        # Then
+        assert dto.is_published is True
+        repository.get_by_id.assert_awaited_once_with(webtoon.id)
+        repository.save.assert_awaited_once_with(webtoon)
+
+    @pytest.mark.asyncio
+    async def test_publish_missing_webtoon_returns_none(self):
+        """Publishing an unknown webtoon returns None."""
+        # Given
+        repository = AsyncMock()
+        repository.mutate = AsyncMock(return_value=None)
+        service = WebtoonService(repository, WebtoonRenderer())
+
+        # When
+        dto = await service.publish_webtoon(Webtoon().id)
+
+        # Then
+        assert dto is None
+
+
+class TestAddToWebtoon:
+    """Tests for adding characters and panels to a webtoon."""
+
+    @pytest.fixture
+    def webtoon(self):
+        """Create a stored webtoon."""
+        return Webtoon(title="Skyline")
+
+    @pytest.fixture
+    def service(self, webtoon):
+        """Create a service whose repository mutates through BaseRepository.mutate."""
+        repository = AsyncMock()
+        repository.get_by_id = AsyncMock(return_value=webtoon)
+        repository.save = AsyncMock(side_effect=lambda entity: entity)
+        repository.mutate = functools.partial(BaseRepository.mutate, repository)
+        return WebtoonService(repository, WebtoonRenderer())
+
+    @pytest.mark.asyncio
+    async def test_add_character_saves_the_new_character(self, service, webtoon):
+        """The character is built from the request fields and saved on the webtoon."""
+        # When
+        dto = await service.add_character(
+            webtoon.id,
+            name="Mira",
+            description="A young mage",
+            appearance_data={"hair_color": "silver", "distinctive_features": ["scar"]},
+            personality_traits=["curious"],
+            role="protagonist",
+        )
+
+        # Then
+        character = webtoon.characters[0]
+        assert character.appearance.hair_color == "silver"
+        assert character.role == "protagonist"
+        assert dto.characters[0].name == "Mira"
+        service.repository.save.assert_awaited_once_with(webtoon)
+
+    @pytest.mark.asyncio
+    async def test_add_panel_saves_the_new_panel(self, service, webtoon):
+        """The panel is built from the scene description and sized by name."""
+        # When
+        dto = await service.add_panel(
+            webtoon.id,
+            scene_description="Rooftop chase at dusk",
+            character_names=["Mira"],
+            panel_size="half",
+        )
+
+        # Then
+        panel = webtoon.panels[0]
+        assert panel.scene.character_names == ["Mira"]
+        assert panel.dimensions.size is PanelSize.HALF
+        assert dto.panel_count == 1
+        service.repository.save.assert_awaited_once_with(webtoon)
+
+    @pytest.mark.asyncio
+    async def test_add_panel_rejects_unknown_size(self, service):
+        """An unknown panel size is rejected before anything is saved."""
+        # When / Then
+        with pytest.raises(ValueError):
+            await service.add_panel(Webtoon().id, "Rooftop chase at dusk", [], "poster")
+        service.repository.save.assert_not_called()
+
+
+class TestWebtoonHtmlContent:
+    """Tests for rendering a webtoon page."""
+
+    @pytest.mark.asyncio
+    async def test_page_wraps_rendered_webtoon(self):
+        """The page holds the escaped title, the CSS and the rendered webtoon."""
+        # Given
+        webtoon = Webtoon(title="Cats & Dogs")
+        repository = AsyncMock()
+        repository.get_by_ids = AsyncMock(return_value={webtoon.id: webtoon})
+        renderer = WebtoonRenderer()
+        service = WebtoonService(repository, renderer)
+
+        # When
+        page = await service.get_webtoon_html_content(webtoon.id)
+
+        # Then
+        assert page.startswith("<!DOCTYPE html>")
+        assert "<title>Cats &amp; Dogs</title>" in page
+        assert renderer.render_css_styles() in page
+        assert renderer.render_webtoon(webtoon) in page
@@ -105,6 +105,28 @@ class TestBaseErrorHandler:
         error_response, _ = handler.sent_errors[0]
         assert error_response["message"] == "Handler error"
     
+    def test_format_error_details(self, handler: TestErrorHandler):
+        """Test details are copied when present and defaulted only on request."""
+        assert "details" not in handler.format_error(TestError("Plain"))
+        assert handler.format_error(TestError("Plain"), include_details=True)["details"] == {}
+        assert handler.format_error(TestErrorWithDetails("Rich", {"a": 1}))["details"] == {"a": 1}
+    
+    def test_log_error_includes_context(self, handler: TestErrorHandler, caplog):
+        """Test the logged message carries the error and its context."""
+        with caplog.at_level("ERROR", logger=handler.logger.name):
+            handler._log_error(TestError("Boom"), {"client_id": "c1"})
+        
+        assert caplog.messages == ["Error: Boom (context: {'client_id': 'c1'})"]
+    
+    def test_log_error_skips_work_when_disabled(self, handler: TestErrorHandler):
+        """Test nothing is formatted when ERROR logging is off."""
+        error = MagicMock(spec=TestError)
+        
+        with patch.object(handler.logger, "isEnabledFor", return_value=False):
+            handler._log_error(error, {"client_id": "c1"})
+        
+        error.__str__.assert_not_called()
+    
     def test_decorator_syntax(self, handler: TestErrorHandler):
         """Test using the handler as a decorator."""
         @handler()
@@ -0,0 +1,37 @@
+"""
+Tests for the application error types.
+"""
+from app.core.error_handling.errors import AppError, NotFoundError, ValidationError
+
+
+class TestAppError:
+    """Tests for error codes and status codes."""
+
+    def test_subclass_uses_class_codes(self):
+        """Subclasses take their code and status from class attributes."""
+        error = NotFoundError("Webtoon", "w1")
+
+        assert error.error_code == "NOT_FOUND"
+        assert error.status_code == 404
+        assert error.details == {"resource": "Webtoon", "resource_id": "w1"}
+
+    def test_plain_app_error_defaults(self):
+        """A bare AppError is a 500 coded with its class name."""
+        error = AppError()
+
+        assert error.error_code == "AppError"
+        assert error.status_code == 500
+
+    def test_explicit_codes_override_class_defaults(self):
+        """Codes passed to the constructor win for that instance only."""
+        error = AppError("Teapot", error_code="TEAPOT", status_code=418)
+
+        assert (error.error_code, error.status_code) == ("TEAPOT", 418)
+        assert (AppError.error_code, AppError.status_code) == (None, 500)
+
+    def test_details_are_not_shared(self):
+        """Each error gets its own details dict."""
+        first, second = ValidationError(), ValidationError()
+        first.details["field"] = "title"
+
+        assert second.details == {}
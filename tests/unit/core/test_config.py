@@ -0,0 +1,28 @@
+"""
+Tests for application settings.
+"""
+import pytest
+
+from app.config import Settings, _parse_cors_origins
+
+
+class TestCorsOrigins:
+    """Tests for parsing the CORS origins setting."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("http://a.test", ("http://a.test",)),
+            ("http://a.test, http://b.test", ("http://a.test", "http://b.test")),
+            ('["http://a.test", "http://b.test"]', ("http://a.test", "http://b.test")),
+        ],
+    )
+    def test_parses_string_forms(self, value, expected):
+        """Single, comma-separated and JSON array strings all become tuples."""
+        assert _parse_cors_origins(value) == expected
+
+    def test_settings_accept_a_list(self):
+        """A list of origins is stored as a tuple."""
+        settings = Settings(cors_origins=["http://a.test"])
+
+        assert settings.cors_origins == ("http://a.test",)
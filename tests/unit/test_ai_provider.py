@@ -136,6 +136,66 @@ class TestOpenAIProvider:
             assert "Hero" in scene["characters"]
             assert scene["dialogue"][0]["character"] == "Hero"
 
+    @pytest.mark.asyncio
+    async def test_generate_story_and_scenes(self, ai_provider):
+        """Test combined story and scene generation uses a single completion"""
+        mock_choice = AsyncMock()
+        mock_message = AsyncMock()
+        mock_message.content = json.dumps(
+            {
+                "story": {
+                    "title": "Test Story",
+                    "main_characters": [{"name": "Hero", "role": "protagonist"}],
+                },
+                "scenes": [
+                    {
+                        "visual_description": "Hero stands in the village square",
+                        "characters": ["Hero"],
+                    }
+                ],
+            }
+        )
+        mock_choice.message = mock_message
+        mock_response = AsyncMock()
+        mock_response.choices = [mock_choice]
+
+        with patch.object(
+            ai_provider.client.chat.completions,
+            "create",
+            AsyncMock(return_value=mock_response),
+        ) as mock_create:
+            story, scenes = await ai_provider.generate_story_and_scenes(
+                "A brave hero saves the world", "fantasy", None, 1
+            )
+
+            mock_create.assert_awaited_once()
+            assert story["title"] == "Test Story"
+            assert story["main_characters"][0]["name"] == "Hero"
+            assert scenes[0]["visual_description"] == "Hero stands in the village square"
+            assert scenes[0]["panel_size"] == "full"
+
+    @pytest.mark.asyncio
+    async def test_generate_story_and_scenes_falls_back_without_story(
+        self, ai_provider, mock_openai_response
+    ):
+        """Test that a response without the story object falls back to separate calls"""
+        scenes = [{"visual_description": "Hero stands in the village square"}]
+
+        with patch.object(
+            ai_provider.client.chat.completions,
+            "create",
+            AsyncMock(return_value=mock_openai_response),
+        ), patch.object(
+            ai_provider, "generate_scene_descriptions", AsyncMock(return_value=scenes)
+        ) as mock_scenes:
+            story, result = await ai_provider.generate_story_and_scenes(
+                "A brave hero saves the world", "fantasy", None, 1
+            )
+
+            assert story["title"] == "Test Story"
+            assert result == scenes
+            mock_scenes.assert_awaited_once_with(story, 1)
+
 
 class TestAIOperation:
     """Test ai_operation decorator"""
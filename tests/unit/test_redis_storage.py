@@ -3,6 +3,7 @@ Tests for RedisStorage implementation
 """
 import json
 from datetime import datetime, timezone
+from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock, patch, call, ANY
 import pytest
 import pytest_asyncio
@@ -60,6 +61,33 @@ class TestRedisStorage:
         yield storage
         await storage.close()
 
+    @pytest.mark.asyncio
+    async def test_store_encodes_uuid_and_datetime(self, storage, mock_redis_client):
+        """Test that stored dictionaries are encoded as JSON"""
+        task_id = uuid4()
+        created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        result = await storage.store("task:1", {"id": task_id, "created_at": created_at, 1: "one"})
+
+        assert result is True
+        key, payload = mock_redis_client.set.await_args.args
+        assert key == "task:1"
+        assert json.loads(payload) == {
+            "id": str(task_id),
+            "created_at": "2024-01-02T03:04:05+00:00",
+            "1": "one",
+        }
+
+    @pytest.mark.asyncio
+    async def test_store_many_uses_single_mset(self, storage, mock_redis_client):
+        """Test that store_many writes all keys with one MSET"""
+        result = await storage.store_many({"task:1": {"a": 1}, "task:2": "plain"})
+
+        assert result is True
+        mock_redis_client.mset.assert_awaited_once_with(
+            {"task:1": '{"a":1}', "task:2": "plain"}
+        )
+
     @pytest.mark.asyncio
     async def test_get_sorted_set_range_ascending(self, storage, mock_redis_client):
         """Test getting a range from a sorted set in ascending order"""
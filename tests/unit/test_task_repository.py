@@ -25,6 +25,7 @@ class MockStorageProvider:
     def __init__(self):
         self.store_data = {}
         self.store = AsyncMock(return_value=True)
+        self.store_many = AsyncMock(return_value=True)
         self.retrieve = AsyncMock(side_effect=self._mock_retrieve)
         self.delete = AsyncMock(return_value=True)
         self.exists = AsyncMock(return_value=True)
@@ -102,6 +103,29 @@ class TestTaskRepository:
         with pytest.raises(RuntimeError):
             await self.repository.save(self.task)
     
+    @pytest.mark.asyncio
+    async def test_save_many(self):
+        """Test saving several tasks with one storage write"""
+        # Call save_many method
+        result = await self.repository.save_many([self.task])
+        
+        # Check results
+        assert result == [self.task]
+        self.storage.store_many.assert_called_once_with(
+            {f"task:{self.task_id}": self.mapper.to_dict.return_value}
+        )
+        self.storage.store.assert_not_called()
+        
+    @pytest.mark.asyncio
+    async def test_save_many_error(self):
+        """Test saving several tasks with storage error"""
+        # Configure storage to fail
+        self.storage.store_many.return_value = False
+        
+        # Call save_many method and check exception
+        with pytest.raises(RuntimeError):
+            await self.repository.save_many([self.task])
+    
     @pytest.mark.asyncio
     async def test_get_by_id(self):
         """Test getting a task by ID"""
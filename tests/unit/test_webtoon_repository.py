@@ -137,7 +137,7 @@ class TestWebtoonRepository:
         webtoon_keys = [f"webtoon:{self.webtoon_id}"]
         self.storage.list_keys.return_value = webtoon_keys
         webtoon_data = {"id": str(self.webtoon_id), "title": "Test Webtoon"}
-        self.storage.retrieve.return_value = webtoon_data
+        self.storage.retrieve_many = AsyncMock(return_value=[webtoon_data])
         
         # Call get_all method
         results = await self.repository.get_all()
@@ -146,7 +146,7 @@ class TestWebtoonRepository:
         assert len(results) == 1
         assert results[0] == self.webtoon
         self.storage.list_keys.assert_called_once_with("webtoon:*")
-        self.storage.retrieve.assert_called_once_with(webtoon_keys[0])
+        self.storage.retrieve_many.assert_called_once_with(webtoon_keys)
 
     @pytest.mark.asyncio
     async def test_delete(self):
@@ -198,6 +198,42 @@ class TestWebtoonRepository:
         self.storage.retrieve.assert_called_once_with(f"webtoon:{self.webtoon_id}")
         self.storage.store.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_mutate(self):
+        """Test loading, changing and saving a webtoon in one call"""
+        self.storage.retrieve.return_value = {"id": str(self.webtoon_id), "title": "Test Webtoon"}
+
+        result = await self.repository.mutate(self.webtoon_id, Webtoon.publish)
+
+        assert result is self.webtoon
+        assert result.is_published is True
+        self.storage.retrieve.assert_called_once_with(f"webtoon:{self.webtoon_id}")
+        self.storage.store.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_mutate_not_found(self):
+        """Test mutating a missing webtoon saves nothing"""
+        mutator = MagicMock()
+
+        result = await self.repository.mutate(self.webtoon_id, mutator)
+
+        assert result is None
+        mutator.assert_not_called()
+        self.storage.store.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_by_keyword(self):
+        """Test only stored webtoons matching the keyword are mapped"""
+        hit = {"id": str(self.webtoon_id), "title": "Dragon Quest", "description": ""}
+        miss = {"id": str(uuid.uuid4()), "title": "Cooking", "description": "Soup"}
+        self.storage.retrieve_many = AsyncMock(return_value=[miss, hit, None])
+
+        results = await self.repository.search_by_keyword("dragon")
+
+        assert results == [self.webtoon]
+        self.storage.list_keys.assert_called_once_with("webtoon:*")
+        self.mapper.from_dict.assert_called_once_with(hit)
+
     @pytest.mark.asyncio
     async def test_get_published(self):
         """Test getting published webtoons"""
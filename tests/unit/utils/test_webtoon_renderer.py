@@ -0,0 +1,45 @@
+"""
+Tests for the webtoon renderer.
+"""
+from app.domain.entities.character import Character, CharacterAppearance
+from app.domain.entities.panel import Panel, SpeechBubble
+from app.domain.entities.scene import Scene
+from app.domain.entities.webtoon import Webtoon
+from app.utils.webtoon_renderer import WebtoonRenderer
+
+
+class TestCharacterColors:
+    """Tests for coloring speech bubbles by character."""
+
+    def test_first_character_with_a_name_wins(self):
+        """Names match case-insensitively and the first character keeps its color."""
+        # Given
+        characters = [
+            Character(name="Mira", appearance=CharacterAppearance(hair_color="Silver Blue")),
+            Character(name="mira", appearance=CharacterAppearance(hair_color="red")),
+            Character(name="Tao"),
+        ]
+
+        # When
+        colors = WebtoonRenderer._character_colors(characters)
+
+        # Then
+        assert colors == {"mira": "silver-blue", "tao": "default"}
+
+    def test_bubbles_use_speaker_color(self):
+        """Rendered bubbles carry their speaker's color, or the default."""
+        # Given
+        panel = Panel(scene=Scene(description="Rooftop"))
+        panel.speech_bubbles.append(SpeechBubble(character_name="MIRA", text="Hi"))
+        panel.speech_bubbles.append(SpeechBubble(character_name="Stranger", text="Who?"))
+        webtoon = Webtoon(
+            characters=[Character(name="Mira", appearance=CharacterAppearance(hair_color="silver"))]
+        )
+        webtoon.add_panel(panel)
+
+        # When
+        html = WebtoonRenderer.render_webtoon(webtoon)
+
+        # Then
+        assert 'data-character-color="silver"' in html
+        assert 'data-character-color="default"' in html
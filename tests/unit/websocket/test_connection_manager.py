@@ -0,0 +1,54 @@
+"""
+Tests for the ConnectionManager class.
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from app.websocket.connection_manager import ConnectionManager
+
+
+@pytest.fixture
+def connection_manager():
+    """Create a ConnectionManager with two subscribed clients."""
+    manager = ConnectionManager()
+    for client_id in ("client-1", "client-2"):
+        manager.active_connections[client_id] = AsyncMock()
+        manager.client_subscriptions[client_id] = {"task-1"}
+    manager.task_subscriptions["task-1"] = {"client-1", "client-2"}
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_broadcast_task_update_sends_same_payload(connection_manager):
+    """Test that a task update is encoded once and sent to every subscriber."""
+    await connection_manager.broadcast_task_update("task-1", {"status": "completed"})
+
+    payloads = [
+        ws.send_text.await_args.args[0]
+        for ws in connection_manager.active_connections.values()
+    ]
+    assert payloads[0] is payloads[1]
+    assert json.loads(payloads[0]) == {
+        "type": "task_update", "task_id": "task-1", "status": "completed"
+    }
+
+
+@pytest.mark.asyncio
+async def test_send_raw_disconnects_broken_socket(connection_manager):
+    """Test that a failed send removes the client's connection."""
+    connection_manager.active_connections["client-1"].send_text.side_effect = RuntimeError("closed")
+
+    await connection_manager.send_raw('{"type":"ping"}', "client-1")
+
+    assert "client-1" not in connection_manager.active_connections
+
+
+@pytest.mark.asyncio
+async def test_unserializable_task_update_is_logged_not_raised(connection_manager):
+    """Test that an update that cannot be encoded skips the send and keeps clients."""
+    await connection_manager.broadcast_task_update("task-1", {"result": object()})
+
+    for ws in connection_manager.active_connections.values():
+        ws.send_text.assert_not_called()
+    assert set(connection_manager.active_connections) == {"client-1", "client-2"}